@@ -210,6 +210,7 @@ rm -rf "$RESOURCES_DIR/Project/node_modules"
 rm -rf "$RESOURCES_DIR/Project/dist"
 rm -rf "$RESOURCES_DIR/Project/.git"
 rm -rf "$RESOURCES_DIR/Project/$APP_BUNDLE"
+rm -f "$RESOURCES_DIR/Project/hardware/example_usage.py"
 
 # Create a simple icon (using a system icon for now)
 echo -e "${BLUE}🎨 Setting up app icon...${NC}"
@@ -262,7 +262,7 @@ ipcMain.handle('connect-serial', async (event, options = {}) => {
     // Create serial port connection
     serialPort = new SerialPort({
       path: targetPort,
-      baudRate: options.baudRate || 9600,
+      baudRate: options.baudRate || 115200,
       autoOpen: false,
       // Disable DTR/RTS to prevent Arduino resets
       dtr: false,
@@ -7,15 +7,22 @@ driver selection for Windows (IC Imaging Control), Linux (V4L2), and macOS (UVC)
 """
 
 from .dmk37_controller import DMK37Controller
-from .capabilities import get_capabilities, detect_platform_capabilities
+from .capabilities import (
+    PlatformProfile,
+    get_capabilities,
+    detect_platform_capabilities,
+    get_platform_profile
+)
 
 __version__ = "1.0.0"
 __author__ = "LightWorks Team"
 
 __all__ = [
     "DMK37Controller",
+    "PlatformProfile",
     "get_capabilities", 
-    "detect_platform_capabilities"
+    "detect_platform_capabilities",
+    "get_platform_profile"
 ]
 
 
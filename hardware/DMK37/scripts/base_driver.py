@@ -0,0 +1,109 @@
+"""
+DMK37 Base Driver
+
+Shared simulated backend for the DMK37 platform drivers. Each platform
+driver only supplies its transport label and overrides what differs.
+"""
+
+import time
+import logging
+from collections import deque
+from typing import Optional, Tuple, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+class DMK37Driver:
+    """Base driver; subclasses set the transport label"""
+    
+    __slots__ = ('connected', 'acquiring', 'exposure_us', '_queued')
+    
+    transport = "Generic"
+    
+    def __init__(self):
+        self.connected = False
+        self.acquiring = False
+        self.exposure_us = 1000
+        self._queued = deque()
+    
+    def connect(self, serial: Optional[str]) -> bool:
+        logger.info("Connecting via %s...", self.transport)
+        # Simulate connection
+        self.connected = True
+        return True
+    
+    def disconnect(self) -> bool:
+        self.connected = False
+        return True
+    
+    def is_connected(self) -> bool:
+        return self.connected
+    
+    def start_acquisition(self) -> bool:
+        self.acquiring = True
+        return True
+    
+    def stop_acquisition(self) -> bool:
+        self.acquiring = False
+        return True
+    
+    def is_acquiring(self) -> bool:
+        return self.acquiring
+    
+    def set_exposure(self, exposure_us: int) -> bool:
+        logger.debug("Setting exposure to %sμs (%s)", exposure_us, self.transport)
+        self.exposure_us = exposure_us
+        return True
+    
+    def set_gain(self, gain_db: int) -> bool:
+        logger.debug("Setting gain to %sdB (%s)", gain_db, self.transport)
+        return True
+    
+    def set_roi(self, x: int, y: int, width: int, height: int) -> bool:
+        logger.debug("Setting ROI to %s,%s %sx%s (%s)", x, y, width, height, self.transport)
+        return True
+    
+    def set_pixel_format(self, pixel_format: str) -> bool:
+        logger.debug("Setting pixel format to %s (%s)", pixel_format, self.transport)
+        return True
+    
+    def set_trigger_mode(self, enabled: bool) -> bool:
+        logger.debug("Setting trigger mode: %s (%s)", enabled, self.transport)
+        return True
+    
+    def set_trigger_source(self, source: str) -> bool:
+        logger.debug("Setting trigger source to %s (%s)", source, self.transport)
+        return True
+    
+    def software_trigger(self) -> bool:
+        logger.debug("Software trigger (%s)", self.transport)
+        return True
+    
+    def configure(self, settings: Dict[str, Any]) -> bool:
+        # Apply several settings in one call
+        logger.debug("Applying settings %s (%s)", settings, self.transport)
+        if 'exposure' in settings:
+            self.exposure_us = settings['exposure']
+        return True
+    
+    def enqueue_buffer(self, buffer: bytearray):
+        self._queued.append(buffer)
+    
+    def clear_buffers(self):
+        self._queued.clear()
+    
+    def dequeue_filled(self) -> Optional[Tuple[bytearray, int]]:
+        try:
+            buffer = self._queued.popleft()
+        except IndexError:
+            return None
+        # Simulate exposure and frame data
+        time.sleep(self.exposure_us / 1000000)
+        frame = b"mock_frame_data"
+        # Never resize a pooled buffer; release_frame() drops any that change size
+        length = min(len(frame), len(buffer))
+        buffer[:length] = frame[:length]
+        return buffer, length
+
+
+
+
@@ -5,67 +5,135 @@ Provides capability detection and platform-specific feature mapping
 for the DMK 37BUX252 camera across Windows, Linux, and macOS.
 """
 
+import functools
+import importlib.util
 import platform
+import sys
 import json
 import os
-from typing import Dict, Any, Optional
+import subprocess
+from collections import ChainMap
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, FrozenSet, Mapping
+
+try:
+    # Optional faster JSON parser; falls back to the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
+# Platform key used in device-config.json (unknown platforms use macOS/UVC)
+_PLATFORM_KEY = (
+    'windows' if sys.platform == 'win32'
+    else 'linux' if sys.platform.startswith('linux')
+    else 'macos'
+)
+
+# Path to device-config.json, resolved once at import
+_CONFIG_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'device-config.json')
+)
+
+# Parsed capabilities keyed by the config file's mtime: (st_mtime_ns, capabilities)
+_config_cache: Optional[Tuple[int, Dict[str, Any]]] = None
 
 # Load capabilities from device-config.json
 def load_device_capabilities() -> Dict[str, Any]:
-    """Load capabilities from device-config.json"""
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'device-config.json')
+    """Load capabilities from device-config.json, re-reading only when it changes"""
+    global _config_cache
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        return config.get('capabilities', {})
+        mtime = os.stat(_CONFIG_PATH).st_mtime_ns
+        if _config_cache is not None and _config_cache[0] == mtime:
+            return _config_cache[1]
+        
+        with open(_CONFIG_PATH, 'rb') as f:
+            data = f.read()
+        config = orjson.loads(data) if orjson is not None else json.loads(data)
+        capabilities = config.get('capabilities', {})
+        _config_cache = (mtime, capabilities)
+        return capabilities
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Warning: Could not load device capabilities: {e}")
         return {}
 
-def get_capabilities() -> Dict[str, Any]:
-    """Get capabilities for current platform"""
-    capabilities = load_device_capabilities()
-    current_platform = platform.system().lower()
+@dataclass(frozen=True)
+class PlatformProfile:
+    """Immutable capability profile for the current platform"""
+    __slots__ = ('os', 'transport', 'features', 'limits', 'limited')
     
-    # Map platform names
-    platform_map = {
-        'windows': 'windows',
-        'linux': 'linux', 
-        'darwin': 'macos'
-    }
+    os: str
+    transport: str
+    features: FrozenSet[str]
+    limits: Mapping[str, Any]
+    limited: Tuple[str, ...]
+
+@functools.lru_cache(maxsize=1)
+def get_platform_profile() -> PlatformProfile:
+    """Get everything known about the current platform in a single call"""
+    return PlatformProfile(
+        os=_CAPS.get('os', 'Unknown'),
+        transport=_CAPS.get('transport', 'Unknown'),
+        features=frozenset(feature for feature, supported in _FEATURES.items() if supported),
+        limits=_LIMITS_VIEW,
+        limited=tuple(feature for feature, supported in _FEATURES.items() if not supported)
+    )
+
+def _read_only(capabilities: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Wrap a capabilities dict and its nested sections in read-only views"""
+    # Nested sections too, so callers can't change features behind _SUPPORTED_FEATURES
+    return MappingProxyType({
+        key: MappingProxyType(value) if isinstance(value, dict) else value
+        for key, value in capabilities.items()
+    })
+
+def reload_capabilities() -> None:
+    """Re-derive current platform capabilities, picking up edits to device-config.json"""
+    global _CAPS, _CAPS_VIEW, _FEATURES, _LIMITS, _LIMITS_VIEW, _SUPPORTED_FEATURES, _LIMITED_FEATURES
+    capabilities = load_device_capabilities()
+    _CAPS = capabilities.get(_PLATFORM_KEY) or capabilities.get('macos') or {}
+    _FEATURES = _CAPS.get('features', {})
+    _LIMITS = _CAPS.get('limits', {})
+    _CAPS_VIEW = _read_only(_CAPS)
+    _LIMITS_VIEW = _CAPS_VIEW.get('limits', MappingProxyType(_LIMITS))
+    get_platform_profile.cache_clear()
+    get_platform_info.cache_clear()
     
-    platform_key = platform_map.get(current_platform, 'macos')
-    return capabilities.get(platform_key, capabilities.get('macos', {}))
+    # Bound at module level so the hot checks are a single lookup
+    profile = get_platform_profile()
+    _SUPPORTED_FEATURES = profile.features
+    _LIMITED_FEATURES = profile.limited
 
-def detect_platform_capabilities() -> Dict[str, Any]:
+def get_capabilities() -> Mapping[str, Any]:
+    """Get capabilities for current platform (read-only view)"""
+    return _CAPS_VIEW
+
+def detect_platform_capabilities() -> Mapping[str, Any]:
     """Detect actual platform capabilities at runtime"""
-    base_capabilities = get_capabilities()
-    detected_capabilities = base_capabilities.copy()
-    
-    current_platform = platform.system().lower()
+    detected_capabilities = _CAPS_VIEW
     
     try:
-        if current_platform == 'windows':
+        if sys.platform == 'win32':
             # Check for IC Imaging Control
             has_ic_imaging = check_ic_imaging_control()
             if not has_ic_imaging:
                 # Fallback to UVC capabilities
+                # Layer UVC capabilities over the static ones without copying
                 uvc_caps = load_device_capabilities().get('macos', {})
-                detected_capabilities.update(uvc_caps)
-                detected_capabilities['transport'] = 'UVC'
+                detected_capabilities = ChainMap({'transport': 'UVC'}, _read_only(uvc_caps), _CAPS_VIEW)
                 print("IC Imaging Control not found, falling back to UVC")
                 
-        elif current_platform == 'linux':
+        elif sys.platform.startswith('linux'):
             # Check for V4L2
             has_v4l2 = check_v4l2_support()
             if not has_v4l2:
                 # Fallback to UVC capabilities
+                # Layer UVC capabilities over the static ones without copying
                 uvc_caps = load_device_capabilities().get('macos', {})
-                detected_capabilities.update(uvc_caps)
-                detected_capabilities['transport'] = 'UVC'
+                detected_capabilities = ChainMap({'transport': 'UVC'}, _read_only(uvc_caps), _CAPS_VIEW)
                 print("V4L2 not found, falling back to UVC")
                 
-        elif current_platform == 'darwin':
+        elif sys.platform == 'darwin':
             # Check for UVC support
             has_uvc = check_uvc_support()
             if not has_uvc:
@@ -77,71 +145,99 @@ def detect_platform_capabilities() -> Dict[str, Any]:
         
     return detected_capabilities
 
+@functools.lru_cache(maxsize=1)
 def check_ic_imaging_control() -> bool:
     """Check if IC Imaging Control is available on Windows"""
+    if sys.platform != 'win32':
+        return False
+    
+    # Resolve the module without importing it when it is not installed
+    if importlib.util.find_spec('ic_imaging_control') is None:
+        return False
+    
     try:
-        # Try to import IC Imaging Control
+        # Installed; make sure the native library actually loads
         import ic_imaging_control
         return True
-    except ImportError:
+    except (ImportError, OSError):
         return False
 
+@functools.lru_cache(maxsize=1)
 def check_v4l2_support() -> bool:
     """Check if V4L2 is available on Linux"""
-    try:
-        import v4l2
+    if not sys.platform.startswith('linux'):
+        return False
+    
+    if importlib.util.find_spec('v4l2') is not None:
         return True
-    except ImportError:
-        # Check if V4L2 devices exist
-        import glob
-        video_devices = glob.glob('/dev/video*')
-        return len(video_devices) > 0
+    
+    # Check if V4L2 devices exist
+    return _has_video_device()
+
+def _has_video_device() -> bool:
+    """Check for a /dev/video* node without stat-ing every entry"""
+    try:
+        with os.scandir('/dev') as entries:
+            return any(entry.name.startswith('video') for entry in entries)
+    except OSError:
+        return False
 
+@functools.lru_cache(maxsize=1)
 def check_uvc_support() -> bool:
     """Check if UVC is available on macOS"""
-    try:
-        import cv2
-        # Try to open a camera
-        cap = cv2.VideoCapture(0)
-        if cap.isOpened():
-            cap.release()
-            return True
+    if sys.platform != 'darwin':
         return False
-    except ImportError:
+    
+    # UVC capture goes through CoreMediaIO; skip the device probe without it
+    if not os.path.exists('/System/Library/Frameworks/CoreMediaIO.framework'):
         return False
-
-def get_limited_features() -> list:
-    """Get list of features that are limited on current platform"""
-    capabilities = get_capabilities()
-    features = capabilities.get('features', {})
     
-    limited = []
-    for feature, supported in features.items():
-        if not supported:
-            limited.append(feature)
+    # Enumerate capture devices without opening a stream, so no camera
+    # permission prompt or AVFoundation pipeline start-up is triggered
+    if importlib.util.find_spec('AVFoundation') is not None:
+        from AVFoundation import AVCaptureDevice, AVMediaTypeVideo
+        return len(AVCaptureDevice.devicesWithMediaType_(AVMediaTypeVideo)) > 0
     
-    return limited
+    return _has_usb_video_interface()
+
+def _has_usb_video_interface() -> bool:
+    """Check the USB registry for a video-class (UVC) interface"""
+    try:
+        result = subprocess.run(
+            ['ioreg', '-r', '-c', 'IOUSBHostDevice', '-l'],
+            capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    # USB interface class 14 is Video
+    return '"bInterfaceClass" = 14\n' in result.stdout
+
+def get_limited_features() -> Tuple[str, ...]:
+    """Get features that are limited on current platform"""
+    return _LIMITED_FEATURES
 
 def is_feature_supported(feature: str) -> bool:
     """Check if a specific feature is supported on current platform"""
-    capabilities = get_capabilities()
-    features = capabilities.get('features', {})
-    return features.get(feature, False)
-
-def get_feature_limits() -> Dict[str, Any]:
-    """Get feature limits for current platform"""
-    capabilities = get_capabilities()
-    return capabilities.get('limits', {})
-
-def get_platform_info() -> Dict[str, str]:
-    """Get platform information"""
-    capabilities = get_capabilities()
-    return {
-        'os': capabilities.get('os', 'Unknown'),
-        'transport': capabilities.get('transport', 'Unknown'),
+    return feature in _SUPPORTED_FEATURES
+
+def get_feature_limits() -> Mapping[str, Any]:
+    """Get feature limits for current platform (read-only view)"""
+    return _LIMITS_VIEW
+
+@functools.lru_cache(maxsize=1)
+def get_platform_info() -> Mapping[str, str]:
+    """Get platform information (computed on first call, read-only)"""
+    # platform.version() can spawn a subprocess on Windows, so it runs once
+    profile = get_platform_profile()
+    return MappingProxyType({
+        'os': profile.os,
+        'transport': profile.transport,
         'platform': platform.system(),
         'version': platform.version()
-    }
+    })
+
+# Capabilities for the current platform, fixed until reload_capabilities()
+reload_capabilities()
 
 
 
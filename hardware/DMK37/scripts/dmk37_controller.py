@@ -5,10 +5,27 @@ Main controller class for DMK 37BUX252 camera with cross-platform support.
 Automatically selects the best available driver for the current platform.
 """
 
-import platform
-import time
-from typing import Optional, Callable, Dict, Any, Tuple
-from .capabilities import get_capabilities, is_feature_supported, get_feature_limits
+import sys
+import functools
+import importlib
+import logging
+import queue
+import threading
+from collections import deque
+from types import MappingProxyType
+from typing import Optional, Callable, Dict, Any, Tuple, Mapping
+from .capabilities import get_capabilities, get_feature_limits
+
+logger = logging.getLogger(__name__)
+
+# sys.platform is fixed for the process ('linux2' on old Pythons)
+_PLATFORM = 'linux' if sys.platform.startswith('linux') else sys.platform
+
+# Frame buffer size per pixel for each supported pixel format
+_BYTES_PER_PIXEL = {'Mono8': 1, 'Mono12': 2, 'RGB24': 3}
+
+# How long stop_acquisition() waits for each acquisition thread to exit
+_THREAD_JOIN_TIMEOUT_S = 5.0
 
 class DMK37Error(Exception):
     """Base exception for DMK37 camera errors"""
@@ -30,7 +47,18 @@ class DMK37Controller:
     and capability-based feature availability.
     """
     
-    def __init__(self):
+    __slots__ = (
+        'connected', 'acquiring', 'model', 'serial', 'firmware_version',
+        'capabilities', 'limits', '_limits_view', '_supported', '_limited_features',
+        '_has_exposure', '_has_gain', '_has_roi', '_has_mono12', '_has_hw_trigger', '_has_sw_trigger',
+        '_exposure_range', '_gain_range', '_max_roi_size',
+        'exposure', 'gain', 'roi_x', 'roi_y', 'roi_w', 'roi_h',
+        'trigger_mode', 'trigger_source', 'pixel_format',
+        '_applied', 'frame_callbacks', 'buffer_count', '_frames',
+        '_frame_bytes', '_frame_ready', '_producer', '_dispatcher', '_delivered', '_stop', '_driver'
+    )
+    
+    def __init__(self, buffer_count: int = 8):
         self.connected = False
         self.acquiring = False
         self.model = "DMK 37BUX252"
@@ -40,33 +68,70 @@ class DMK37Controller:
         # Get platform capabilities
         self.capabilities = get_capabilities()
         self.limits = self.capabilities.get('limits', {})
+        self._limits_view = MappingProxyType(self.limits)
+        
+        # Feature support and limits resolved once for the setter hot paths
+        self._supported = frozenset(f for f, supported in self.capabilities.get('features', {}).items() if supported)
+        self._limited_features = ', '.join(f for f, supported in self.capabilities.get('features', {}).items() if not supported)
+        self._has_exposure = 'exposure' in self._supported
+        self._has_gain = 'gain' in self._supported
+        self._has_roi = 'roi' in self._supported
+        self._has_mono12 = 'mono12' in self._supported
+        self._has_hw_trigger = 'hardwareTrigger' in self._supported
+        self._has_sw_trigger = 'softwareTrigger' in self._supported
+        self._exposure_range = (self.limits.get('minExposure', 1), self.limits.get('maxExposure', 1000000))
+        self._gain_range = (self.limits.get('minGain', 0), self.limits.get('maxGain', 100))
+        self._max_roi_size = (self.limits.get('maxWidth', 1920), self.limits.get('maxHeight', 1080))
         
         # Current settings
         self.exposure = 1000  # microseconds
         self.gain = 0  # dB
-        self.roi = (0, 0, 1920, 1080)  # x, y, width, height
+        self.roi_x = 0
+        self.roi_y = 0
+        self.roi_w = 1920
+        self.roi_h = 1080
         self.trigger_mode = False
         self.trigger_source = "Software"
-        
-        # Frame callbacks
-        self.frame_callbacks = []
+        self.pixel_format = "RGB24"
+        
+        # Settings last accepted by the driver, so unchanged ones are not re-sent
+        self._applied = dict.fromkeys(('exposure', 'gain', 'roi', 'pixel_format', 'trigger_mode', 'trigger_source'))
+        
+        # Frame callbacks; replaced rather than mutated so the producer
+        # thread can iterate a snapshot without locking
+        self.frame_callbacks: Tuple[Callable[[memoryview], None], ...] = ()
+        
+        # Bounded ring of delivered frames backed by a pool of
+        # pre-allocated buffers queued to the driver; the oldest frame is
+        # recycled when full.
+        # The dispatcher appends, the producer recycles from the old end and
+        # consumers pop from either end; single deque operations are atomic,
+        # but any check-then-pop sequence holds _frame_ready's lock
+        self.buffer_count = buffer_count
+        self._frames = deque(maxlen=buffer_count)
+        self._frame_bytes = 0
+        self._frame_ready = threading.Condition()
+        
+        # While acquiring, a producer thread fills pool buffers from the
+        # driver and a dispatcher thread runs callbacks before adding each
+        # frame to the ring, so callbacks run concurrently with capture
+        self._producer = None
+        self._dispatcher = None
+        self._delivered = queue.Queue()
+        self._stop = threading.Event()
         
         # Platform-specific driver
         self._driver = None
         self._init_driver()
     
+    @property
+    def roi(self) -> Tuple[int, int, int, int]:
+        """Current region of interest as (x, y, width, height)"""
+        return (self.roi_x, self.roi_y, self.roi_w, self.roi_h)
+    
     def _init_driver(self):
         """Initialize platform-specific driver"""
-        current_platform = platform.system().lower()
-        
-        if current_platform == 'windows':
-            self._driver = WindowsDMK37Driver()
-        elif current_platform == 'linux':
-            self._driver = LinuxDMK37Driver()
-        elif current_platform == 'darwin':
-            self._driver = MacOSDMK37Driver()
-        else:
-            raise DMK37Error(f"Unsupported platform: {current_platform}")
+        self._driver = _driver_class()()
     
     def connect(self, serial: Optional[str] = None) -> bool:
         """
@@ -86,13 +151,13 @@ class DMK37Controller:
             if success:
                 self.connected = True
                 self.serial = serial or "DMK37-001"
-                print(f"Connected to {self.model} (Serial: {self.serial})")
-                print(f"Platform: {self.capabilities['os']} ({self.capabilities['transport']})")
+                logger.info("Connected to %s (Serial: %s)", self.model, self.serial)
                 
-                # Show limited features
-                limited_features = [f for f, supported in self.capabilities['features'].items() if not supported]
-                if limited_features:
-                    print(f"Limited features: {', '.join(limited_features)}")
+                # Show platform and limited features
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Platform: %s (%s)", self.capabilities['os'], self.capabilities['transport'])
+                    if self._limited_features:
+                        logger.info("Limited features: %s", self._limited_features)
             return success
         except Exception as e:
             raise ConnectionError(f"Failed to connect: {e}")
@@ -110,7 +175,8 @@ class DMK37Controller:
         success = self._driver.disconnect()
         if success:
             self.connected = False
-            print("Disconnected from camera")
+            self._applied = dict.fromkeys(self._applied)
+            logger.info("Disconnected from camera")
         return success
     
     def is_connected(self) -> bool:
@@ -130,24 +196,37 @@ class DMK37Controller:
         if not self.connected:
             raise DMK37Error("Camera not connected")
         
+        if self.acquiring:
+            return True
+        
         try:
             # Configure camera settings
-            self._driver.set_exposure(self.exposure)
-            self._driver.set_gain(self.gain)
+            settings = {'exposure': self.exposure, 'gain': self.gain, 'pixel_format': self.pixel_format}
             
-            if is_feature_supported('roi'):
-                self._driver.set_roi(*self.roi)
+            if self._has_roi:
+                settings['roi'] = self.roi
             
-            if is_feature_supported('hardwareTrigger'):
-                self._driver.set_trigger_mode(self.trigger_mode)
+            if self._has_hw_trigger:
+                settings['trigger_mode'] = self.trigger_mode
                 if self.trigger_mode:
-                    self._driver.set_trigger_source(self.trigger_source)
+                    settings['trigger_source'] = self.trigger_source
+            
+            # Send only what changed since it was last applied, in one driver call
+            changes = {key: value for key, value in settings.items() if self._applied[key] != value}
+            if changes and self._driver.configure(changes):
+                self._applied.update(changes)
             
             # Start acquisition
+            self._prepare_buffers()
             success = self._driver.start_acquisition()
             if success:
                 self.acquiring = True
-                print("Acquisition started")
+                self._stop.clear()
+                self._producer = threading.Thread(target=self._pump, name="DMK37Producer", daemon=True)
+                self._dispatcher = threading.Thread(target=self._dispatch, name="DMK37Dispatcher", daemon=True)
+                self._producer.start()
+                self._dispatcher.start()
+                logger.info("Acquisition started")
             return success
         except Exception as e:
             raise DMK37Error(f"Failed to start acquisition: {e}")
@@ -159,10 +238,21 @@ class DMK37Controller:
         Returns:
             True if acquisition stopped successfully
         """
+        self._stop.set()
+        with self._frame_ready:
+            self._frame_ready.notify_all()
+        producer, dispatcher = self._producer, self._dispatcher
+        self._producer = self._dispatcher = None
+        if producer is not None:
+            for thread in (producer, dispatcher):
+                thread.join(_THREAD_JOIN_TIMEOUT_S)
+                if thread.is_alive():
+                    logger.warning("%s did not exit within %ss", thread.name, _THREAD_JOIN_TIMEOUT_S)
+        
         success = self._driver.stop_acquisition()
         if success:
             self.acquiring = False
-            print("Acquisition stopped")
+            logger.info("Acquisition stopped")
         return success
     
     def is_acquiring(self) -> bool:
@@ -186,12 +276,11 @@ class DMK37Controller:
         if not self.connected:
             raise DMK37Error("Camera not connected")
         
-        if not is_feature_supported('exposure'):
+        if not self._has_exposure:
             raise UnsupportedFeatureError("Exposure control not supported on this platform")
         
         # Check limits
-        min_exp = self.limits.get('minExposure', 1)
-        max_exp = self.limits.get('maxExposure', 1000000)
+        min_exp, max_exp = self._exposure_range
         
         if exposure_us < min_exp or exposure_us > max_exp:
             raise DMK37Error(f"Exposure must be between {min_exp} and {max_exp} microseconds")
@@ -199,7 +288,8 @@ class DMK37Controller:
         success = self._driver.set_exposure(exposure_us)
         if success:
             self.exposure = exposure_us
-            print(f"Exposure set to {exposure_us}μs")
+            self._applied['exposure'] = exposure_us
+            logger.debug("Exposure set to %sμs", exposure_us)
         return success
     
     def set_gain(self, gain_db: int) -> bool:
@@ -219,12 +309,11 @@ class DMK37Controller:
         if not self.connected:
             raise DMK37Error("Camera not connected")
         
-        if not is_feature_supported('gain'):
+        if not self._has_gain:
             raise UnsupportedFeatureError("Gain control not supported on this platform")
         
         # Check limits
-        min_gain = self.limits.get('minGain', 0)
-        max_gain = self.limits.get('maxGain', 100)
+        min_gain, max_gain = self._gain_range
         
         if gain_db < min_gain or gain_db > max_gain:
             raise DMK37Error(f"Gain must be between {min_gain} and {max_gain} dB")
@@ -232,7 +321,8 @@ class DMK37Controller:
         success = self._driver.set_gain(gain_db)
         if success:
             self.gain = gain_db
-            print(f"Gain set to {gain_db}dB")
+            self._applied['gain'] = gain_db
+            logger.debug("Gain set to %sdB", gain_db)
         return success
     
     def set_roi(self, x: int, y: int, width: int, height: int) -> bool:
@@ -255,20 +345,70 @@ class DMK37Controller:
         if not self.connected:
             raise DMK37Error("Camera not connected")
         
-        if not is_feature_supported('roi'):
+        if not self._has_roi:
             raise UnsupportedFeatureError("ROI not supported on this platform")
         
         # Check limits
-        max_width = self.limits.get('maxWidth', 1920)
-        max_height = self.limits.get('maxHeight', 1080)
+        max_width, max_height = self._max_roi_size
         
         if width > max_width or height > max_height:
             raise DMK37Error(f"ROI size must not exceed {max_width}x{max_height}")
         
+        # Offset-only changes apply live; a new frame size needs the
+        # buffer pool resized, which happens when acquisition restarts
+        restart = self.acquiring and (width != self.roi_w or height != self.roi_h)
+        if restart:
+            self.stop_acquisition()
+        
         success = self._driver.set_roi(x, y, width, height)
         if success:
-            self.roi = (x, y, width, height)
-            print(f"ROI set to {x},{y} {width}x{height}")
+            self.roi_x, self.roi_y, self.roi_w, self.roi_h = x, y, width, height
+            self._applied['roi'] = (x, y, width, height)
+            logger.debug("ROI set to %s,%s %sx%s", x, y, width, height)
+        
+        if restart:
+            self.start_acquisition()
+        return success
+    
+    def set_pixel_format(self, pixel_format: str) -> bool:
+        """
+        Set the pixel format frames are delivered in
+        
+        Selecting the format on the camera avoids converting frames after
+        capture; use "Mono8" when only luminance is needed.
+        
+        Args:
+            pixel_format: Pixel format ("RGB24", "Mono8", "Mono12")
+            
+        Returns:
+            True if setting successful
+            
+        Raises:
+            DMK37Error: If not connected or setting fails
+            UnsupportedFeatureError: If Mono12 not supported
+        """
+        if not self.connected:
+            raise DMK37Error("Camera not connected")
+        
+        if pixel_format not in _BYTES_PER_PIXEL:
+            raise DMK37Error("Invalid pixel format")
+        
+        if pixel_format == "Mono12" and not self._has_mono12:
+            raise UnsupportedFeatureError("Mono12 not supported on this platform")
+        
+        # The buffer pool is sized by pixel format, so restart a running acquisition
+        restart = self.acquiring and pixel_format != self.pixel_format
+        if restart:
+            self.stop_acquisition()
+        
+        success = self._driver.set_pixel_format(pixel_format)
+        if success:
+            self.pixel_format = pixel_format
+            self._applied['pixel_format'] = pixel_format
+            logger.debug("Pixel format set to %s", pixel_format)
+        
+        if restart:
+            self.start_acquisition()
         return success
     
     def set_trigger_mode(self, enabled: bool) -> bool:
@@ -288,13 +428,14 @@ class DMK37Controller:
         if not self.connected:
             raise DMK37Error("Camera not connected")
         
-        if not is_feature_supported('hardwareTrigger'):
+        if not self._has_hw_trigger:
             raise UnsupportedFeatureError("Hardware trigger not supported on this platform")
         
         success = self._driver.set_trigger_mode(enabled)
         if success:
             self.trigger_mode = enabled
-            print(f"Trigger mode {'enabled' if enabled else 'disabled'}")
+            self._applied['trigger_mode'] = enabled
+            logger.debug("Trigger mode %s", 'enabled' if enabled else 'disabled')
         return success
     
     def set_trigger_source(self, source: str) -> bool:
@@ -314,7 +455,7 @@ class DMK37Controller:
         if not self.connected:
             raise DMK37Error("Camera not connected")
         
-        if not is_feature_supported('hardwareTrigger'):
+        if not self._has_hw_trigger:
             raise UnsupportedFeatureError("Hardware trigger not supported on this platform")
         
         if source not in ["Software", "Line0", "Line1"]:
@@ -323,7 +464,8 @@ class DMK37Controller:
         success = self._driver.set_trigger_source(source)
         if success:
             self.trigger_source = source
-            print(f"Trigger source set to {source}")
+            self._applied['trigger_source'] = source
+            logger.debug("Trigger source set to %s", source)
         return success
     
     def software_trigger(self) -> bool:
@@ -340,224 +482,231 @@ class DMK37Controller:
         if not self.connected:
             raise DMK37Error("Camera not connected")
         
-        if not is_feature_supported('softwareTrigger'):
+        if not self._has_sw_trigger:
             raise UnsupportedFeatureError("Software trigger not supported on this platform")
         
         success = self._driver.software_trigger()
         if success:
-            print("Software trigger executed")
+            logger.debug("Software trigger executed")
         return success
     
-    def get_frame(self) -> Optional[bytes]:
+    def get_frame(self) -> Optional[memoryview]:
+        """
+        Get the oldest buffered frame
+        
+        The returned view shares memory with a pre-allocated frame buffer;
+        pass it to release_frame() once it is no longer needed.
+        
+        Returns:
+            Frame data as a memoryview, or None if no frame available
+        """
+        if not self.connected or not self.acquiring:
+            return None
+        
+        try:
+            return self._frames.popleft()
+        except IndexError:
+            return None
+    
+    def wait_frame(self, timeout: Optional[float] = 1.0) -> Optional[memoryview]:
+        """
+        Wait for the oldest buffered frame
+        
+        Like get_frame(), but blocks until a frame arrives instead of
+        returning None straight away.
+        
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+            
+        Returns:
+            Frame data as a memoryview, or None on timeout or when acquisition stops
+        """
+        if not self.connected or not self.acquiring:
+            return None
+        
+        with self._frame_ready:
+            if not self._frame_ready.wait_for(lambda: self._frames or self._stop.is_set(), timeout):
+                return None
+            
+            try:
+                return self._frames.popleft()
+            except IndexError:
+                return None
+    
+    def get_latest_frame(self) -> Optional[memoryview]:
         """
-        Get latest frame data
+        Get the newest buffered frame, discarding older ones
+        
+        Never waits for the camera, so display loops can poll it at
+        their own rate; use get_frame() when every frame is needed.
         
         Returns:
-            Frame data as bytes, or None if no frame available
+            Frame data as a memoryview, or None if no frame available
         """
         if not self.connected or not self.acquiring:
             return None
         
-        return self._driver.get_frame()
+        # Locked so a frame appended midway can't be recycled or skipped
+        with self._frame_ready:
+            for _ in range(len(self._frames) - 1):
+                self._recycle_oldest()
+            
+            try:
+                return self._frames.pop()
+            except IndexError:
+                return None
+    
+    def release_frame(self, frame: memoryview):
+        """Release a frame returned by get_frame() or get_latest_frame() back to the buffer pool"""
+        buffer = frame.obj
+        frame.release()
+        # Buffers from a pool replaced by a frame size change are dropped
+        if len(buffer) == self._frame_bytes:
+            self._driver.enqueue_buffer(buffer)
+    
+    def get_frame_format(self) -> Dict[str, Any]:
+        """
+        Get the layout of frames returned by get_frame()
+        
+        Returns:
+            Dict with width, height, pixel_format and bytes_per_pixel, so
+            callers can reshape frame views without converting them
+        """
+        return {
+            'width': self.roi_w,
+            'height': self.roi_h,
+            'pixel_format': self.pixel_format,
+            'bytes_per_pixel': _BYTES_PER_PIXEL[self.pixel_format],
+        }
+    
+    def _pump(self):
+        """Producer loop run on the acquisition thread"""
+        # Resolve the per-frame lookups once for the lifetime of the loop
+        capture_frame = self._capture_frame
+        dequeue_filled = self._driver.dequeue_filled
+        stopped = self._stop.is_set
+        try:
+            while not stopped():
+                capture_frame(dequeue_filled)
+        except Exception:
+            logger.exception("Frame capture failed; producer thread exiting")
+        finally:
+            # Let the dispatcher finish the frames already captured
+            self._delivered.put(None)
+    
+    def _dispatch(self):
+        """Callback loop run on the dispatcher thread"""
+        next_frame = self._delivered.get
+        on_frame_ready = self._on_frame_ready
+        while True:
+            frame = next_frame()
+            if frame is None:
+                break
+            on_frame_ready(frame)
+    
+    def _prepare_buffers(self):
+        """Queue frame buffers sized to the current ROI and pixel format to the driver"""
+        frame_bytes = self.roi_w * self.roi_h * _BYTES_PER_PIXEL[self.pixel_format]
+        if frame_bytes != self._frame_bytes:
+            # Every buffer is queued before streaming starts, so the
+            # driver always has somewhere to write the next frame
+            self._frames.clear()
+            self._driver.clear_buffers()
+            self._frame_bytes = frame_bytes
+            for _ in range(self.buffer_count):
+                self._driver.enqueue_buffer(bytearray(frame_bytes))
+        else:
+            # Same frame size; return frames left from the last run to the pool
+            while self._frames:
+                self.release_frame(self._frames.popleft())
+    
+    def _capture_frame(self, dequeue_filled: Callable[[], Optional[Tuple[bytearray, int]]]):
+        """Take the next filled buffer from the driver and pass it to the dispatcher"""
+        filled = dequeue_filled()
+        if filled is None:
+            with self._frame_ready:
+                if self._frames:
+                    # No buffer queued to the driver; recycle the oldest unread frame
+                    self._recycle_oldest()
+                    return
+            # Every buffer is held by a consumer; wait out one frame
+            self._stop.wait(self.exposure / 1000000)
+            return
+        
+        buffer, length = filled
+        if length:
+            self._delivered.put(memoryview(buffer)[:length])
+        else:
+            self._driver.enqueue_buffer(buffer)
     
-    def on_frame(self, callback: Callable[[bytes], None]):
+    def _recycle_oldest(self):
+        """Return the oldest unread frame's buffer to the pool"""
+        try:
+            frame = self._frames.popleft()
+        except IndexError:
+            # The consumer took it first
+            return
+        self.release_frame(frame)
+    
+    def _on_frame_ready(self, frame: memoryview):
+        """Notify callbacks of a captured frame, then buffer it"""
+        # The frame is not in the ring yet, so it cannot be recycled
+        # while callbacks are still reading it
+        for callback in self.frame_callbacks:
+            try:
+                callback(frame)
+            except Exception:
+                logger.exception("Frame callback %r failed", callback)
+        
+        with self._frame_ready:
+            if len(self._frames) == self.buffer_count:
+                # Ring is full; recycle the oldest frame's buffer
+                self._recycle_oldest()
+            self._frames.append(frame)
+            self._frame_ready.notify()
+    
+    def on_frame(self, callback: Callable[[memoryview], None]):
         """Register frame callback"""
-        self.frame_callbacks.append(callback)
+        self.frame_callbacks = self.frame_callbacks + (callback,)
     
-    def off_frame(self, callback: Callable[[bytes], None]):
+    def off_frame(self, callback: Callable[[memoryview], None]):
         """Unregister frame callback"""
         if callback in self.frame_callbacks:
-            self.frame_callbacks.remove(callback)
+            callbacks = list(self.frame_callbacks)
+            callbacks.remove(callback)
+            self.frame_callbacks = tuple(callbacks)
     
-    def get_capabilities(self) -> Dict[str, Any]:
-        """Get current platform capabilities"""
-        return self.capabilities.copy()
+    def get_capabilities(self) -> Mapping[str, Any]:
+        """Get a read-only view of current platform capabilities"""
+        return self.capabilities
     
-    def get_limits(self) -> Dict[str, Any]:
-        """Get feature limits for current platform"""
-        return self.limits.copy()
+    def get_limits(self) -> Mapping[str, Any]:
+        """Get a read-only view of feature limits for current platform"""
+        return self._limits_view
     
     def is_feature_supported(self, feature: str) -> bool:
         """Check if feature is supported on current platform"""
-        return is_feature_supported(feature)
+        return feature in self._supported
 
 
-# Platform-specific driver implementations
+# Driver module and class for each supported sys.platform value; the
+# module is imported only when a controller selects it
+_DRIVER_CLASSES = {
+    'win32': ('.windows_driver', 'WindowsDMK37Driver'),
+    'linux': ('.linux_driver', 'LinuxDMK37Driver'),
+    'darwin': ('.macos_driver', 'MacOSDMK37Driver')
+}
 
-class WindowsDMK37Driver:
-    """Windows driver using IC Imaging Control"""
-    
-    def __init__(self):
-        self.connected = False
-        self.acquiring = False
-    
-    def connect(self, serial: Optional[str]) -> bool:
-        print("Connecting via IC Imaging Control...")
-        # Simulate connection
-        self.connected = True
-        return True
-    
-    def disconnect(self) -> bool:
-        self.connected = False
-        return True
-    
-    def is_connected(self) -> bool:
-        return self.connected
-    
-    def start_acquisition(self) -> bool:
-        self.acquiring = True
-        return True
-    
-    def stop_acquisition(self) -> bool:
-        self.acquiring = False
-        return True
-    
-    def is_acquiring(self) -> bool:
-        return self.acquiring
-    
-    def set_exposure(self, exposure_us: int) -> bool:
-        print(f"Setting exposure to {exposure_us}μs (IC Imaging Control)")
-        return True
-    
-    def set_gain(self, gain_db: int) -> bool:
-        print(f"Setting gain to {gain_db}dB (IC Imaging Control)")
-        return True
-    
-    def set_roi(self, x: int, y: int, width: int, height: int) -> bool:
-        print(f"Setting ROI to {x},{y} {width}x{height} (IC Imaging Control)")
-        return True
-    
-    def set_trigger_mode(self, enabled: bool) -> bool:
-        print(f"Setting trigger mode: {enabled} (IC Imaging Control)")
-        return True
-    
-    def set_trigger_source(self, source: str) -> bool:
-        print(f"Setting trigger source to {source} (IC Imaging Control)")
-        return True
-    
-    def software_trigger(self) -> bool:
-        print("Software trigger (IC Imaging Control)")
-        return True
-    
-    def get_frame(self) -> Optional[bytes]:
-        # Simulate frame data
-        return b"mock_frame_data"
 
-
-class LinuxDMK37Driver:
-    """Linux driver using V4L2"""
-    
-    def __init__(self):
-        self.connected = False
-        self.acquiring = False
-    
-    def connect(self, serial: Optional[str]) -> bool:
-        print("Connecting via V4L2...")
-        # Simulate connection
-        self.connected = True
-        return True
-    
-    def disconnect(self) -> bool:
-        self.connected = False
-        return True
-    
-    def is_connected(self) -> bool:
-        return self.connected
-    
-    def start_acquisition(self) -> bool:
-        self.acquiring = True
-        return True
-    
-    def stop_acquisition(self) -> bool:
-        self.acquiring = False
-        return True
-    
-    def is_acquiring(self) -> bool:
-        return self.acquiring
-    
-    def set_exposure(self, exposure_us: int) -> bool:
-        print(f"Setting exposure to {exposure_us}μs (V4L2)")
-        return True
-    
-    def set_gain(self, gain_db: int) -> bool:
-        print(f"Setting gain to {gain_db}dB (V4L2)")
-        return True
-    
-    def set_roi(self, x: int, y: int, width: int, height: int) -> bool:
-        print(f"Setting ROI to {x},{y} {width}x{height} (V4L2)")
-        return True
-    
-    def set_trigger_mode(self, enabled: bool) -> bool:
-        print(f"Setting trigger mode: {enabled} (V4L2)")
-        return True
-    
-    def set_trigger_source(self, source: str) -> bool:
-        print(f"Setting trigger source to {source} (V4L2)")
-        return True
-    
-    def software_trigger(self) -> bool:
-        print("Software trigger (V4L2)")
-        return True
-    
-    def get_frame(self) -> Optional[bytes]:
-        # Simulate frame data
-        return b"mock_frame_data"
-
-
-class MacOSDMK37Driver:
-    """macOS driver using UVC (limited features)"""
-    
-    def __init__(self):
-        self.connected = False
-        self.acquiring = False
-    
-    def connect(self, serial: Optional[str]) -> bool:
-        print("Connecting via UVC (limited features)...")
-        # Simulate connection
-        self.connected = True
-        return True
-    
-    def disconnect(self) -> bool:
-        self.connected = False
-        return True
-    
-    def is_connected(self) -> bool:
-        return self.connected
-    
-    def start_acquisition(self) -> bool:
-        self.acquiring = True
-        return True
-    
-    def stop_acquisition(self) -> bool:
-        self.acquiring = False
-        return True
-    
-    def is_acquiring(self) -> bool:
-        return self.acquiring
-    
-    def set_exposure(self, exposure_us: int) -> bool:
-        print(f"Setting exposure to {exposure_us}μs (UVC)")
-        return True
-    
-    def set_gain(self, gain_db: int) -> bool:
-        print(f"Setting gain to {gain_db}dB (UVC)")
-        return True
-    
-    def set_roi(self, x: int, y: int, width: int, height: int) -> bool:
-        raise UnsupportedFeatureError("ROI not supported on macOS UVC")
-    
-    def set_trigger_mode(self, enabled: bool) -> bool:
-        raise UnsupportedFeatureError("Hardware trigger not supported on macOS UVC")
-    
-    def set_trigger_source(self, source: str) -> bool:
-        raise UnsupportedFeatureError("Hardware trigger not supported on macOS UVC")
-    
-    def software_trigger(self) -> bool:
-        raise UnsupportedFeatureError("Software trigger not supported on macOS UVC")
-    
-    def get_frame(self) -> Optional[bytes]:
-        # Simulate frame data
-        return b"mock_frame_data"
+@functools.lru_cache(maxsize=1)
+def _driver_class():
+    """Import and return the driver class for this platform"""
+    driver = _DRIVER_CLASSES.get(_PLATFORM)
+    if driver is None:
+        raise DMK37Error(f"Unsupported platform: {_PLATFORM}")
+    module_name, class_name = driver
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, class_name)
 
 
 
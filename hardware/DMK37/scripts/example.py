@@ -7,11 +7,12 @@ capability detection and cross-platform support.
 """
 
 import sys
-import time
+import logging
 from dmk37_controller import DMK37Controller, DMK37Error, UnsupportedFeatureError
 
 def main():
     """Main example function"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("DMK37 Camera Example")
     print("=" * 50)
     
@@ -79,12 +80,12 @@ def main():
             # Capture a few frames
             print("Capturing frames...")
             for i in range(5):
-                frame = camera.get_frame()
+                frame = camera.wait_frame(timeout=1.0)
                 if frame:
                     print(f"  Frame {i+1}: {len(frame)} bytes")
+                    camera.release_frame(frame)
                 else:
                     print(f"  Frame {i+1}: No data")
-                time.sleep(0.1)
             
             # Software trigger (if supported)
             try:
@@ -0,0 +1,19 @@
+"""
+DMK37 Linux Driver
+
+V4L2 backend for the DMK37 controller. Imported only when selected
+for the current platform.
+"""
+
+from .base_driver import DMK37Driver
+
+class LinuxDMK37Driver(DMK37Driver):
+    """Linux driver using V4L2"""
+    
+    __slots__ = ()
+    
+    transport = "V4L2"
+
+
+
+
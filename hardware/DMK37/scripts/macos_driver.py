@@ -0,0 +1,40 @@
+"""
+DMK37 macOS Driver
+
+UVC backend for the DMK37 controller. Imported only when selected
+for the current platform.
+"""
+
+from typing import Dict, Any
+from .base_driver import DMK37Driver
+from .dmk37_controller import UnsupportedFeatureError
+
+class MacOSDMK37Driver(DMK37Driver):
+    """macOS driver using UVC (limited features)"""
+    
+    __slots__ = ()
+    
+    transport = "UVC"
+    
+    def set_roi(self, x: int, y: int, width: int, height: int) -> bool:
+        raise UnsupportedFeatureError("ROI not supported on macOS UVC")
+    
+    def set_trigger_mode(self, enabled: bool) -> bool:
+        raise UnsupportedFeatureError("Hardware trigger not supported on macOS UVC")
+    
+    def set_trigger_source(self, source: str) -> bool:
+        raise UnsupportedFeatureError("Hardware trigger not supported on macOS UVC")
+    
+    def software_trigger(self) -> bool:
+        raise UnsupportedFeatureError("Software trigger not supported on macOS UVC")
+    
+    def configure(self, settings: Dict[str, Any]) -> bool:
+        if 'roi' in settings:
+            raise UnsupportedFeatureError("ROI not supported on macOS UVC")
+        if 'trigger_mode' in settings or 'trigger_source' in settings:
+            raise UnsupportedFeatureError("Hardware trigger not supported on macOS UVC")
+        return super().configure(settings)
+
+
+
+
@@ -0,0 +1,19 @@
+"""
+DMK37 Windows Driver
+
+IC Imaging Control backend for the DMK37 controller. Imported only
+when selected for the current platform.
+"""
+
+from .base_driver import DMK37Driver
+
+class WindowsDMK37Driver(DMK37Driver):
+    """Windows driver using IC Imaging Control"""
+    
+    __slots__ = ()
+    
+    transport = "IC Imaging Control"
+
+
+
+
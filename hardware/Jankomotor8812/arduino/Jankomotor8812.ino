@@ -265,7 +265,7 @@ void setup(){
   pinMode(TRIGGER_OUT_PIN, OUTPUT);  digitalWrite(TRIGGER_OUT_PIN, LOW);
   if (CLK_8801 >= 0) pinMode(CLK_8801, INPUT); // optional
 
-  Serial.begin(9600);
+  Serial.begin(115200);
   while(!Serial){;}
   st.last_heartbeat_ms = millis();
 
@@ -16,7 +16,16 @@ Example:
 import sys
 import time
 import logging
-from jankomotor_controller import SimpleJankomotorController
+from jankomotor_controller import SimpleJankomotorController, ResponseError
+
+def print_position(controller, label):
+    """Print the current position, or why it couldn't be read"""
+    try:
+        pos = controller.get_position()
+    except ResponseError as e:
+        print(f"{label}: unavailable ({e})")
+        return
+    print(f"{label}: X={pos.x}, Y={pos.y}")
 
 def main():
     # Configure logging
@@ -45,31 +54,34 @@ def main():
             return 1
         
         # Get initial position
-        pos = controller.get_position()
-        print(f"Initial position: X={pos.x}, Y={pos.y}")
+        print_position(controller, "Initial position")
         
         # Move to a position
         print("Moving to position (1000, 500)...")
         if controller.move_to(1000, 500):
-            pos = controller.get_position()
-            print(f"New position: X={pos.x}, Y={pos.y}")
+            print_position(controller, "New position")
         else:
             print("Move failed")
         
         # Move relative
         print("Moving relative (-200, +300)...")
         if controller.move_relative(-200, 300):
-            pos = controller.get_position()
-            print(f"New position: X={pos.x}, Y={pos.y}")
+            print_position(controller, "New position")
         else:
             print("Move failed")
         
         # Get status
-        status = controller.get_status()
-        print(f"System status: {status}")
+        try:
+            print(f"System status: {controller.get_status()}")
+        except ResponseError as e:
+            print(f"System status unavailable: {e}")
         
-        # Get safety status
-        safety = controller.get_safety_status()
+        # Get safety status; don't carry on scanning without it
+        try:
+            safety = controller.get_safety_status()
+        except ResponseError as e:
+            print(f"Safety status unavailable: {e}")
+            return 1
         print(f"Safety status: {safety}")
         
         # Example raster scan
@@ -85,8 +97,7 @@ def main():
         # Home position
         print("Homing motors...")
         if controller.home():
-            pos = controller.get_position()
-            print(f"Homed to: X={pos.x}, Y={pos.y}")
+            print_position(controller, "Homed to")
         else:
             print("Home failed")
         
@@ -18,28 +18,129 @@ Usage:
     controller.disconnect()
 """
 
+import os
 import serial
 import time
+import asyncio
+import inspect
 import logging
-from typing import Tuple, Optional, Callable
+import re
+import threading
+from collections import deque
+from typing import Tuple, Optional, Callable, Iterable, Iterator, List, Sequence, Literal
 from dataclasses import dataclass
 
+ScanPoint = Tuple[int, int, int, int]
+ScanPattern = Literal["raster", "serpentine", "tsp"]
+
+# Reply formats, e.g. "POS X=123 Y=456" and "STATUS EN=1 MV=0 X=123 Y=456"
+_POSITION_RE = re.compile(r'POS X=(-?\d+) Y=(-?\d+)$')
+_STATUS_RE = re.compile(r'STATUS EN=(\d) MV=(\d) X=(-?\d+) Y=(-?\d+)$')
+# The bundled A/B/C sketch replies "STATUS MOVING=0 A=1 B=2 C=3" instead
+_CORNER_STATUS_RE = re.compile(r'STATUS MOVING=(\d) A=(-?\d+) B=(-?\d+) C=(-?\d+)$')
+# SAFETY carries a variable set of flags, e.g. "SAFETY E=0 OC=0"
+_SAFETY_RE = re.compile(r'SAFETY((?: \w+=\d)+)$')
+_SAFETY_FIELD_RE = re.compile(r'(\w+)=(\d)')
+
+# Safety flag names by firmware key
+_SAFETY_KEYS = {
+    'E': 'emergency_stop', 'ESTOP': 'emergency_stop',
+    'XMIN': 'x_limit_min', 'XMAX': 'x_limit_max',
+    'YMIN': 'y_limit_min', 'YMAX': 'y_limit_max',
+    'OC': 'current_overload'
+}
+# Field order of the six-flag SAFETY reply when its keys aren't recognised
+_SAFETY_LEGACY_ORDER = ('emergency_stop', 'x_limit_min', 'x_limit_max',
+                        'y_limit_min', 'y_limit_max', 'current_overload')
+
+# 2-opt is O(n^2) per pass; beyond this the greedy route is used as-is
+TSP_2OPT_MAX_POINTS = 1000
+
+def _scan_deltas(scan: List[ScanPoint]) -> Iterator[Tuple[int, int]]:
+    """Relative (dx, dy) moves that walk a scan from its first point"""
+    for (x0, y0, _, _), (x1, y1, _, _) in zip(scan, scan[1:]):
+        yield x1 - x0, y1 - y0
+
+def _travel(a: ScanPoint, b: ScanPoint) -> int:
+    """Steps between two points; the axes move one after the other"""
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+def _order_tsp(points: List[ScanPoint], start: Tuple[int, int]) -> List[ScanPoint]:
+    """Order points by greedy nearest neighbour from start, then 2-opt"""
+    route = [(start[0], start[1], -1, -1)]
+    remaining = list(points)
+    while remaining:
+        last = route[-1]
+        nearest = min(range(len(remaining)), key=lambda i: _travel(last, remaining[i]))
+        route.append(remaining.pop(nearest))
+    
+    if len(route) <= TSP_2OPT_MAX_POINTS:
+        improved = True
+        while improved:
+            improved = False
+            for i in range(1, len(route) - 1):
+                for j in range(i + 1, len(route)):
+                    a, b, c = route[i - 1], route[i], route[j]
+                    before = _travel(a, b)
+                    after = _travel(a, c)
+                    if j + 1 < len(route):
+                        d = route[j + 1]
+                        before += _travel(c, d)
+                        after += _travel(b, d)
+                    if after < before:
+                        route[i:j + 1] = route[i:j + 1][::-1]
+                        improved = True
+    
+    # Drop the start position
+    return route[1:]
+
+class ResponseError(Exception):
+    """Raised when a reply from the Arduino can't be parsed"""
+    pass
+
 @dataclass
 class Position:
+    # Mutable (move_relative updates it in place) but without a per-instance __dict__
+    __slots__ = ('x', 'y')
+    
     x: int
     y: int
 
 class SimpleJankomotorController:
     """Simple high-level controller for Jankomotor 8812"""
     
-    def __init__(self, port: str, baudrate: int = 9600, timeout: float = 1.0):
+    # Silence after a partial reply that counts as a dropped line ending
+    LINE_GAP_S = 0.05
+    
+    # MOVE commands kept in flight during a callback-free scan; a "MOVE X
+    # -12345" line is ~14 bytes, so 4 fit the Arduino's 64-byte RX buffer
+    PIPELINE_CREDIT = 4
+    
+    # A command line takes well under 2 ms at 115200 baud; longer means the
+    # peer or USB link has stalled
+    WRITE_TIMEOUT_S = 0.05
+    
+    def __init__(self, port: str, baudrate: int = 115200, timeout: float = 1.0,
+                 low_latency: bool = True, ready_timeout: float = 5.0):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.low_latency = low_latency
+        self.ready_timeout = ready_timeout
         self.serial_conn: Optional[serial.Serial] = None
         self.logger = logging.getLogger(__name__)
         self.position = Position(0, 0)
         self.enabled = False
+        # Cached position tracks commanded moves; re-query when it may be wrong
+        self._position_stale = True
+        # Serialises command/response pairs so status can be polled from
+        # another thread or task while a scan is running
+        self._io_lock = threading.Lock()
+        # Bytes after the last newline, and complete lines not yet returned
+        self._rx_buf = b''
+        self._pending_lines: deque = deque()
+        # Whether the firmware accepts "MOVE XY dx dy"; None until first tried
+        self._combined_moves: Optional[bool] = None
         
     def connect(self) -> bool:
         """Connect to Arduino controller"""
@@ -47,25 +148,49 @@ class SimpleJankomotorController:
             self.serial_conn = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
-                timeout=self.timeout
+                timeout=self.timeout,
+                write_timeout=self.WRITE_TIMEOUT_S,
+                rtscts=False,
+                dsrdtr=False,
+                # Only POSIX needs asking; Windows ports are always exclusive
+                **({'exclusive': True} if os.name == 'posix' else {})
             )
-            time.sleep(2)  # Wait for Arduino to initialize
+            if self.low_latency:
+                self._set_low_latency()
+            self._rx_buf = b''
+            self._pending_lines.clear()
+            self._combined_moves = None
             
-            # Read ready message
-            response = self.serial_conn.readline().decode('ascii').strip()
-            self.logger.info(f"Arduino response: {response}")
+            # Poll for the ready message instead of sleeping through the reset
+            deadline = time.monotonic() + self.ready_timeout
+            while time.monotonic() < deadline:
+                response = self._read_line()
+                if response:
+                    self.logger.info("Arduino response: %s", response)
+                if "READY" in response:
+                    # Drop banner lines that arrived with READY so they aren't
+                    # taken as replies to the first command
+                    self._pending_lines.clear()
+                    self.logger.info("Connected to Jankomotor controller")
+                    return True
             
-            if "READY" in response:
-                self.logger.info("Connected to Jankomotor controller")
-                return True
-            else:
-                self.logger.error("Arduino not ready")
-                return False
+            self.logger.error("Arduino not ready")
+            return False
                 
         except serial.SerialException as e:
-            self.logger.error(f"Failed to connect: {e}")
+            self.logger.error("Failed to connect: %s", e)
             return False
     
+    def _set_low_latency(self):
+        """Ask the USB-serial driver to skip its latency timer (Linux only)"""
+        set_low_latency_mode = getattr(self.serial_conn, 'set_low_latency_mode', None)
+        if set_low_latency_mode is None:
+            return
+        try:
+            set_low_latency_mode(True)
+        except (OSError, ValueError) as e:
+            self.logger.debug("Low-latency mode unavailable: %s", e)
+    
     def disconnect(self):
         """Disconnect from Arduino"""
         if self.serial_conn and self.serial_conn.is_open:
@@ -75,15 +200,72 @@ class SimpleJankomotorController:
     
     def _send_command(self, command: str) -> str:
         """Send command to Arduino and return response"""
+        return self._send_raw((command + '\n').encode('ascii'))
+    
+    def _send_raw(self, cmd_bytes: bytes) -> str:
+        """Send a newline-terminated, pre-encoded command and return response"""
         if not self.serial_conn or not self.serial_conn.is_open:
             raise ConnectionError("Not connected to Arduino")
         
-        cmd_bytes = (command + '\n').encode('ascii')
-        self.serial_conn.write(cmd_bytes)
-        response = self.serial_conn.readline().decode('ascii').strip()
-        self.logger.debug(f"Sent: {command}, Received: {response}")
+        with self._io_lock:
+            self._write(cmd_bytes)
+            response = self._read_line()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Sent: %s, Received: %s", cmd_bytes.decode('ascii').rstrip(), response)
         return response
     
+    def _write(self, cmd_bytes: bytes):
+        """Write a command, failing fast instead of blocking on a stalled link"""
+        try:
+            self.serial_conn.write(cmd_bytes)
+        except serial.SerialTimeoutException as e:
+            # Part of the line may have gone out, so a blind retry could
+            # corrupt the next command; stop and let the caller resync
+            self._position_stale = True
+            raise ConnectionError(f"Serial write timed out: {e}") from e
+    
+    def _read_line(self) -> str:
+        """Read one reply line, returning as soon as its newline arrives
+        
+        Blocks for the first byte, then drains whatever the OS has buffered.
+        Extra complete lines are queued for later calls and trailing bytes are
+        kept in the receive buffer. A partial line followed by LINE_GAP_S of
+        silence is returned as-is rather than waiting out the full timeout.
+        """
+        if self._pending_lines:
+            return self._pending_lines.popleft()
+        
+        deadline = time.monotonic() + self.timeout
+        last_rx = None
+        while b'\n' not in self._rx_buf:
+            waiting = self.serial_conn.in_waiting
+            if waiting:
+                self._rx_buf += self.serial_conn.read(waiting)
+                last_rx = time.monotonic()
+            elif last_rx is None:
+                first = self.serial_conn.read(1)
+                if not first:
+                    break
+                self._rx_buf += first
+                last_rx = time.monotonic()
+            elif time.monotonic() - last_rx > self.LINE_GAP_S:
+                break
+            else:
+                time.sleep(0.001)
+            if time.monotonic() > deadline:
+                break
+        
+        *lines, self._rx_buf = self._rx_buf.split(b'\n')
+        if not lines:
+            # Timed out or line ending dropped: hand back what arrived
+            lines, self._rx_buf = [self._rx_buf], b''
+        self._pending_lines.extend(line.decode('ascii', errors='replace').strip() for line in lines)
+        return self._pending_lines.popleft()
+    
+    async def send_command_async(self, command: str) -> str:
+        """Send command without blocking the event loop"""
+        return await asyncio.to_thread(self._send_command, command)
+    
     def enable(self) -> bool:
         """Enable motor system"""
         response = self._send_command("ENABLE")
@@ -101,19 +283,34 @@ class SimpleJankomotorController:
         return False
     
     def get_position(self) -> Position:
-        """Get current position"""
+        """Get current position
+        
+        Raises:
+            ResponseError: If the POSITION reply can't be parsed
+        """
         response = self._send_command("POSITION")
-        if response.startswith("POS X="):
-            # Parse: "POS X=123 Y=456"
-            parts = response.split()
-            x = int(parts[1].split('=')[1])
-            y = int(parts[2].split('=')[1])
-            self.position = Position(x, y)
+        match = _POSITION_RE.match(response)
+        if not match:
+            self._position_stale = True
+            raise ResponseError(f"Unexpected POSITION reply: {response!r}")
+        self.position = Position(int(match[1]), int(match[2]))
+        self._position_stale = False
         return self.position
     
-    def move_to(self, x: int, y: int) -> bool:
-        """Move to absolute position"""
-        current = self.get_position()
+    def move_to(self, x: int, y: int, resync: bool = False) -> bool:
+        """Move to absolute position
+        
+        Uses the cached position, which move_relative keeps up to date. The
+        Arduino is only queried when resync is set or the cache is stale
+        (before the first query, after an emergency stop or a failed move).
+        """
+        if resync or self._position_stale:
+            try:
+                self.get_position()
+            except ResponseError as e:
+                self.logger.error("Position resync failed: %s", e)
+                return False
+        current = self.position
         x_steps = x - current.x
         y_steps = y - current.y
         
@@ -125,18 +322,37 @@ class SimpleJankomotorController:
             self.logger.error("System not enabled")
             return False
         
+        # Move both axes in one command when the firmware supports it
+        if x_steps != 0 and y_steps != 0 and self._combined_moves is not False:
+            response = self._send_raw(b"MOVE XY %d %d\n" % (x_steps, y_steps))
+            if response == "OK":
+                self._combined_moves = True
+                self.position.x += x_steps
+                self.position.y += y_steps
+                return True
+            if self._combined_moves is None and response.startswith("ERROR") and "MOVE" in response:
+                # Older firmware rejects the syntax before moving anything
+                self.logger.info("Firmware has no MOVE XY, moving axes separately")
+                self._combined_moves = False
+            else:
+                self.logger.error("XY move failed: %s", response)
+                self._position_stale = True
+                return False
+        
         # Move X axis
         if x_steps != 0:
-            response = self._send_command(f"MOVE X {x_steps}")
+            response = self._send_raw(b"MOVE X %d\n" % x_steps)
             if response != "OK":
-                self.logger.error(f"X move failed: {response}")
+                self.logger.error("X move failed: %s", response)
+                self._position_stale = True
                 return False
         
         # Move Y axis
         if y_steps != 0:
-            response = self._send_command(f"MOVE Y {y_steps}")
+            response = self._send_raw(b"MOVE Y %d\n" % y_steps)
             if response != "OK":
-                self.logger.error(f"Y move failed: {response}")
+                self.logger.error("Y move failed: %s", response)
+                self._position_stale = True
                 return False
         
         # Update position
@@ -145,82 +361,344 @@ class SimpleJankomotorController:
         
         return True
     
+    def _move_pipelined(self, deltas: Iterable[Tuple[int, int]]) -> bool:
+        """Send relative moves with up to PIPELINE_CREDIT awaiting their OK
+        
+        The firmware queues the extra lines in its RX buffer and runs them
+        back to back, so the link never sits idle while the motors move. The
+        cached position advances as each OK arrives.
+        """
+        if not self.serial_conn or not self.serial_conn.is_open:
+            raise ConnectionError("Not connected to Arduino")
+        if not self.enabled:
+            self.logger.error("System not enabled")
+            return False
+        
+        # (x_steps, y_steps) for each command whose OK hasn't arrived yet
+        in_flight: deque = deque()
+        failed = False
+        
+        def take_ack() -> bool:
+            # A queued move only replies after the ones ahead of it finish
+            deadline = time.monotonic() + self.timeout * len(in_flight)
+            response = self._read_line()
+            while not response and time.monotonic() < deadline:
+                response = self._read_line()
+            x_steps, y_steps = in_flight.popleft()
+            if response != "OK":
+                self.logger.error("Pipelined move failed: %s", response)
+                return False
+            self.position.x += x_steps
+            self.position.y += y_steps
+            return True
+        
+        with self._io_lock:
+            for x_steps, y_steps in deltas:
+                if x_steps and y_steps and self._combined_moves:
+                    commands = [(b"MOVE XY %d %d\n" % (x_steps, y_steps), x_steps, y_steps)]
+                else:
+                    commands = [(b"MOVE X %d\n" % x_steps, x_steps, 0)] if x_steps else []
+                    if y_steps:
+                        commands.append((b"MOVE Y %d\n" % y_steps, 0, y_steps))
+                
+                for cmd_bytes, x_part, y_part in commands:
+                    if len(in_flight) >= self.PIPELINE_CREDIT and not take_ack():
+                        failed = True
+                        break
+                    self._write(cmd_bytes)
+                    in_flight.append((x_part, y_part))
+                if failed:
+                    break
+            
+            # Collect the remaining acks; after a failure they are drained only
+            # to keep later replies lined up with their commands
+            while in_flight:
+                if not take_ack():
+                    failed = True
+        
+        if failed:
+            self._position_stale = True
+        return not failed
+    
     def home(self) -> bool:
         """Home both axes"""
         response = self._send_command("HOME")
         if response == "OK":
             self.position = Position(0, 0)
+            self._position_stale = False
             return True
         return False
     
+    def _scan_points(self, x_start: int, y_start: int, x_end: int, y_end: int,
+                     x_step: int, y_step: int, pattern: ScanPattern = "raster",
+                     points: Optional[Sequence[Tuple[int, int]]] = None) -> List[ScanPoint]:
+        """Return (x, y, x_idx, y_idx) for each scan point in visiting order
+        
+        "raster" sweeps every row left to right, "serpentine" reverses odd rows
+        to avoid the retrace, and "tsp" reorders the grid (or the sparse points
+        list, indexed as (i, 0)) to shorten total travel.
+        """
+        if pattern not in ("raster", "serpentine", "tsp"):
+            raise ValueError(f"Unknown scan pattern: {pattern}")
+        
+        if points is not None:
+            if pattern != "tsp":
+                raise ValueError("points are only supported with the 'tsp' pattern")
+            scan = [(x, y, i, 0) for i, (x, y) in enumerate(points)]
+            self.logger.info("Starting %s scan: %s points", pattern, len(scan))
+            return _order_tsp(scan, (self.position.x, self.position.y))
+        
+        if x_step == 0 or y_step == 0:
+            raise ValueError("x_step and y_step must be non-zero")
+        
+        # Calculate scan parameters; floor division keeps the last point
+        # inside the end coordinate when the span isn't a multiple of the step
+        x_points = (x_end - x_start) // x_step
+        y_points = (y_end - y_start) // y_step
+        
+        self.logger.info("Starting %s scan: %sx%s points", pattern, x_points, y_points)
+        
+        # Build each row's (x, x_idx) pairs once and reuse them for every row
+        row = list(zip(range(x_start, x_start + (x_points + 1) * x_step, x_step), range(x_points + 1)))
+        row_reversed = row[::-1]
+        ys = range(y_start, y_start + (y_points + 1) * y_step, y_step)
+        
+        scan = []
+        for y_idx, current_y in enumerate(ys):
+            xs = row_reversed if pattern == "serpentine" and y_idx % 2 else row
+            scan.extend([(current_x, current_y, x_idx, y_idx) for current_x, x_idx in xs])
+        
+        if pattern == "tsp":
+            # Keep the grid origin first; the scan always starts there
+            return [scan[0]] + _order_tsp(scan[1:], (x_start, y_start))
+        return scan
+    
     def raster_scan(self, x_start: int, y_start: int, x_end: int, y_end: int,
-                   x_step: int, y_step: int, callback: Optional[Callable] = None) -> bool:
-        """Perform raster scan with optional callback for each point"""
+                   x_step: int, y_step: int, callback: Optional[Callable] = None,
+                   pattern: ScanPattern = "raster",
+                   points: Optional[Sequence[Tuple[int, int]]] = None,
+                   settle_us: int = 0) -> bool:
+        """Perform raster scan with optional callback for each point
+        
+        pattern selects the visiting order (see _scan_points); pass a sparse
+        points list with pattern="tsp" to visit arbitrary positions. MOVE only
+        replies once the firmware has finished (and settled, see SET_TIMING),
+        so no host-side delay is added unless settle_us is given.
+        """
+        scan = self._scan_points(x_start, y_start, x_end, y_end, x_step, y_step, pattern, points)
+        if not scan:
+            return True
         
         # Move to start position
-        if not self.move_to(x_start, y_start):
+        if not self.move_to(scan[0][0], scan[0][1]):
             return False
         
-        # Calculate scan parameters
-        x_points = (x_end - x_start) // x_step
-        y_points = (y_end - y_start) // y_step
+        # Nothing needs the stage to stop at each point, so keep moves in flight
+        if callback is None and not settle_us:
+            if not self._move_pipelined(_scan_deltas(scan)):
+                self.logger.error("Raster scan failed")
+                return False
+            self.logger.info("Raster scan completed")
+            return True
         
-        self.logger.info(f"Starting raster scan: {x_points}x{y_points} points")
+        # Perform raster scan, stepping by grid deltas from the start point
+        last_x, last_y = scan[0][0], scan[0][1]
+        for current_x, current_y, x_idx, y_idx in scan:
+            # Move to current point
+            x_delta, y_delta = current_x - last_x, current_y - last_y
+            last_x, last_y = current_x, current_y
+            if not self.move_relative(x_delta, y_delta):
+                self.logger.error("Raster scan failed")
+                return False
+            
+            # Call callback if provided
+            if callback:
+                callback(current_x, current_y, x_idx, y_idx)
+            
+            # Optional extra settle time before the next move
+            if settle_us:
+                time.sleep(settle_us / 1e6)
         
-        # Perform raster scan
-        for y_idx in range(y_points + 1):
-            for x_idx in range(x_points + 1):
-                # Calculate current position
-                current_x = x_start + x_idx * x_step
-                current_y = y_start + y_idx * y_step
-                
-                # Move to current point
-                if not self.move_to(current_x, current_y):
-                    self.logger.error("Raster scan failed")
-                    return False
+        self.logger.info("Raster scan completed")
+        return True
+    
+    def raster_scan_streaming(self, x_start: int, y_start: int, x_end: int, y_end: int,
+                              x_step: int, y_step: int, callback: Optional[Callable] = None,
+                              point_timeout: float = 10.0) -> bool:
+        """Perform raster scan as a single firmware-side SCAN command
+        
+        Sends "SCAN x0 y0 x1 y1 dx dy" once and consumes the "POINT x y" lines
+        the firmware reports as it reaches each grid point, until "DONE". The
+        serial line is held for the whole scan, so callbacks must not send
+        commands. Falls back to raster_scan when the firmware doesn't know SCAN.
+        """
+        if not self.serial_conn or not self.serial_conn.is_open:
+            raise ConnectionError("Not connected to Arduino")
+        if not self.enabled:
+            self.logger.error("System not enabled")
+            return False
+        
+        command = f"SCAN {x_start} {y_start} {x_end} {y_end} {x_step} {y_step}"
+        points = 0
+        with self._io_lock:
+            self._write((command + '\n').encode('ascii'))
+            self.logger.debug("Sent: %s", command)
+            last_rx = time.monotonic()
+            while True:
+                line = self._read_line()
+                if not line:
+                    if time.monotonic() - last_rx > point_timeout:
+                        self.logger.error("Raster scan timed out waiting for POINT")
+                        self._position_stale = True
+                        return False
+                    continue
+                last_rx = time.monotonic()
                 
-                # Call callback if provided
-                if callback:
-                    callback(current_x, current_y, x_idx, y_idx)
+                if line == "DONE":
+                    break
+                if line.startswith("POINT"):
+                    # Parse: "POINT 123 456"
+                    parts = line.split()
+                    current_x, current_y = int(parts[1]), int(parts[2])
+                    self.position = Position(current_x, current_y)
+                    points += 1
+                    if callback:
+                        callback(current_x, current_y,
+                                 (current_x - x_start) // x_step,
+                                 (current_y - y_start) // y_step)
+                    continue
+                if line.startswith("ERROR") and points == 0 and "Unknown command" in line:
+                    break
                 
-                # Small delay for stability
-                time.sleep(0.01)
+                self.logger.error("Raster scan failed: %s", line)
+                self._position_stale = True
+                return False
+        
+        if points == 0 and line != "DONE":
+            self.logger.info("Firmware has no SCAN command, scanning point by point")
+            return self.raster_scan(x_start, y_start, x_end, y_end, x_step, y_step, callback)
+        
+        self.logger.info("Raster scan completed")
+        return True
+    
+    async def raster_scan_async(self, x_start: int, y_start: int, x_end: int, y_end: int,
+                                x_step: int, y_step: int, callback: Optional[Callable] = None,
+                                pattern: ScanPattern = "raster",
+                                points: Optional[Sequence[Tuple[int, int]]] = None,
+                                settle_us: int = 0) -> bool:
+        """Perform raster scan without blocking the event loop
+        
+        Serial round-trips run in a worker thread, so other tasks (status
+        polling, camera handling) keep running while the motors move. The
+        callback may be a plain function or a coroutine function.
+        """
+        scan = self._scan_points(x_start, y_start, x_end, y_end, x_step, y_step, pattern, points)
+        if not scan:
+            return True
+        
+        # Move to start position
+        if not await asyncio.to_thread(self.move_to, scan[0][0], scan[0][1]):
+            return False
+        
+        # Nothing needs the stage to stop at each point, so keep moves in flight
+        if callback is None and not settle_us:
+            if not await asyncio.to_thread(self._move_pipelined, _scan_deltas(scan)):
+                self.logger.error("Raster scan failed")
+                return False
+            self.logger.info("Raster scan completed")
+            return True
+        
+        # Perform raster scan, stepping by grid deltas from the start point
+        last_x, last_y = scan[0][0], scan[0][1]
+        for current_x, current_y, x_idx, y_idx in scan:
+            # Move to current point
+            x_delta, y_delta = current_x - last_x, current_y - last_y
+            last_x, last_y = current_x, current_y
+            if not await asyncio.to_thread(self.move_relative, x_delta, y_delta):
+                self.logger.error("Raster scan failed")
+                return False
+            
+            # Call callback if provided
+            if callback:
+                result = callback(current_x, current_y, x_idx, y_idx)
+                if inspect.isawaitable(result):
+                    await result
+            
+            # Optional extra settle time before the next move
+            if settle_us:
+                await asyncio.sleep(settle_us / 1e6)
         
         self.logger.info("Raster scan completed")
         return True
     
     def get_status(self) -> dict:
-        """Get system status"""
+        """Get system status
+        
+        The bundled A/B/C sketch has no enable state and reports corner
+        positions, so its status has a_pos/b_pos/c_pos instead of x_pos/y_pos.
+        
+        Raises:
+            ResponseError: If the STATUS reply can't be parsed
+        """
         response = self._send_command("STATUS")
-        if response.startswith("STATUS"):
-            parts = response.split()
+        match = _STATUS_RE.match(response)
+        if not match:
+            corner_match = _CORNER_STATUS_RE.match(response)
+            if not corner_match:
+                raise ResponseError(f"Unexpected STATUS reply: {response!r}")
+            moving, a_pos, b_pos, c_pos = corner_match.groups()
             return {
-                'enabled': parts[1].split('=')[1] == '1',
-                'moving': parts[2].split('=')[1] == '1',
-                'x_pos': int(parts[3].split('=')[1]),
-                'y_pos': int(parts[4].split('=')[1])
+                'enabled': True,
+                'moving': moving == '1',
+                'a_pos': int(a_pos),
+                'b_pos': int(b_pos),
+                'c_pos': int(c_pos)
             }
-        return {'enabled': False, 'moving': False, 'x_pos': 0, 'y_pos': 0}
+        enabled, moving, x_pos, y_pos = match.groups()
+        return {
+            'enabled': enabled == '1',
+            'moving': moving == '1',
+            'x_pos': int(x_pos),
+            'y_pos': int(y_pos)
+        }
+    
+    async def get_status_async(self) -> dict:
+        """Get system status without blocking the event loop"""
+        return await asyncio.to_thread(self.get_status)
     
     def get_safety_status(self) -> dict:
-        """Get safety system status"""
+        """Get safety system status
+        
+        Only the flags the firmware reports are included; the bundled sketch
+        sends emergency_stop and current_overload but no limit switches.
+        
+        Raises:
+            ResponseError: If the SAFETY reply can't be parsed or has no
+                emergency stop flag
+        """
         response = self._send_command("SAFETY")
-        if response.startswith("SAFETY"):
-            parts = response.split()
-            return {
-                'emergency_stop': parts[1].split('=')[1] == '1',
-                'x_limit_min': parts[2].split('=')[1] == '1',
-                'x_limit_max': parts[3].split('=')[1] == '1',
-                'y_limit_min': parts[4].split('=')[1] == '1',
-                'y_limit_max': parts[5].split('=')[1] == '1',
-                'current_overload': parts[6].split('=')[1] == '1'
-            }
-        return {'emergency_stop': False, 'x_limit_min': False, 'x_limit_max': False,
-                'y_limit_min': False, 'y_limit_max': False, 'current_overload': False}
+        match = _SAFETY_RE.match(response)
+        if not match:
+            raise ResponseError(f"Unexpected SAFETY reply: {response!r}")
+        
+        fields = _SAFETY_FIELD_RE.findall(match[1])
+        if all(key.upper() in _SAFETY_KEYS for key, _ in fields):
+            safety = {_SAFETY_KEYS[key.upper()]: value == '1' for key, value in fields}
+        elif len(fields) == len(_SAFETY_LEGACY_ORDER):
+            safety = {name: value == '1' for name, (_, value) in zip(_SAFETY_LEGACY_ORDER, fields)}
+        else:
+            raise ResponseError(f"Unrecognised SAFETY fields: {response!r}")
+        
+        # Never report "all clear" without the e-stop state
+        if 'emergency_stop' not in safety:
+            raise ResponseError(f"SAFETY reply has no emergency stop flag: {response!r}")
+        return safety
     
     def emergency_stop(self) -> bool:
         """Emergency stop all movement"""
         response = self._send_command("STOP")
+        # Motion was interrupted, so the cached position can't be trusted
+        self._position_stale = True
         return response == "OK"
     
     def set_limits(self, x_min: int, x_max: int, y_min: int, y_max: int) -> bool:
@@ -244,8 +722,11 @@ if __name__ == "__main__":
             controller.move_to(1000, 500)
             
             # Get position
-            pos = controller.get_position()
-            print(f"Current position: X={pos.x}, Y={pos.y}")
+            try:
+                pos = controller.get_position()
+                print(f"Current position: X={pos.x}, Y={pos.y}")
+            except ResponseError as e:
+                print(f"Could not read position: {e}")
             
             # Raster scan with callback
             def scan_callback(x, y, x_idx, y_idx):
@@ -254,8 +735,11 @@ if __name__ == "__main__":
             controller.raster_scan(0, 0, 1000, 1000, 100, 100, scan_callback)
             
             # Get safety status
-            safety = controller.get_safety_status()
-            print(f"Safety status: {safety}")
+            try:
+                safety = controller.get_safety_status()
+                print(f"Safety status: {safety}")
+            except ResponseError as e:
+                print(f"Could not read safety status: {e}")
             
             controller.disable()
             
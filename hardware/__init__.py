@@ -0,0 +1 @@
+# LightWorks Hardware Package
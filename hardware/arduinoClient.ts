@@ -38,7 +38,7 @@ export class ArduinoClient {
           // Use Electron's serial communication
           const result = await (window as any).electronAPI.connectSerial({
             port: this.port || 'auto',
-            baudRate: 9600
+            baudRate: 115200
           })
           
           if (result.success) {
@@ -5,25 +5,44 @@ Provides capability detection and platform-specific feature mapping
 for template devices across Windows, Linux, and macOS.
 """
 
+import functools
+import glob
+import importlib.util
 import platform
 import json
 import os
-from typing import Dict, Any, Optional
+import subprocess
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, FrozenSet, Mapping
+
+# device-config.json sits beside the scripts package, so it is resolved once
+# here rather than through importlib.resources (which can't reach outside it)
+_CONFIG_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'device-config.json')
+)
 
 # Load capabilities from device-config.json
+@functools.lru_cache(maxsize=1)
 def load_device_capabilities() -> Dict[str, Any]:
-    """Load capabilities from device-config.json"""
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'device-config.json')
+    """Load capabilities from device-config.json (parsed once per process)"""
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        with open(_CONFIG_PATH, 'rb') as f:
+            config = json.loads(f.read())
         return config.get('capabilities', {})
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Warning: Could not load device capabilities: {e}")
         return {}
 
-def get_capabilities() -> Dict[str, Any]:
-    """Get capabilities for current platform"""
+def _read_only(capabilities: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Wrap a capabilities dict and its nested sections in read-only views"""
+    return MappingProxyType({
+        key: MappingProxyType(value) if isinstance(value, dict) else value
+        for key, value in capabilities.items()
+    })
+
+@functools.lru_cache(maxsize=1)
+def get_capabilities() -> Mapping[str, Any]:
+    """Get capabilities for current platform (read-only view, shared by all callers)"""
     capabilities = load_device_capabilities()
     current_platform = platform.system().lower()
     
@@ -35,12 +54,13 @@ def get_capabilities() -> Dict[str, Any]:
     }
     
     platform_key = platform_map.get(current_platform, 'macos')
-    return capabilities.get(platform_key, capabilities.get('macos', {}))
+    return _read_only(capabilities.get(platform_key, capabilities.get('macos', {})))
 
-def detect_platform_capabilities() -> Dict[str, Any]:
-    """Detect actual platform capabilities at runtime"""
+@functools.lru_cache(maxsize=1)
+def detect_platform_capabilities() -> Mapping[str, Any]:
+    """Detect actual platform capabilities at runtime (probes run once per process, read-only view)"""
     base_capabilities = get_capabilities()
-    detected_capabilities = base_capabilities.copy()
+    detected_capabilities = dict(base_capabilities)
     
     current_platform = platform.system().lower()
     
@@ -75,7 +95,18 @@ def detect_platform_capabilities() -> Dict[str, Any]:
         print(f"Warning: Capability detection failed: {e}")
         # Use static capabilities as fallback
         
-    return detected_capabilities
+    return _read_only(detected_capabilities)
+
+def invalidate_capabilities_cache() -> None:
+    """Forget cached config and detection results, e.g. after editing device-config.json
+    
+    Values already bound by template_controller are not affected; use its
+    reload_capabilities() to refresh those as well.
+    """
+    load_device_capabilities.cache_clear()
+    get_capabilities.cache_clear()
+    detect_platform_capabilities.cache_clear()
+    _feature_index.cache_clear()
 
 def check_native_driver() -> bool:
     """Check if native Windows driver is available"""
@@ -88,50 +119,63 @@ def check_native_driver() -> bool:
 
 def check_v4l2_support() -> bool:
     """Check if V4L2 is available on Linux"""
-    try:
-        import v4l2
+    # Locate the bindings without importing them
+    if importlib.util.find_spec('v4l2') is not None:
         return True
-    except ImportError:
-        # Check if V4L2 devices exist
-        import glob
-        video_devices = glob.glob('/dev/video*')
-        return len(video_devices) > 0
+    
+    # Check if V4L2 devices exist
+    return bool(glob.glob('/dev/video*'))
 
 def check_uvc_support() -> bool:
-    """Check if UVC is available on macOS"""
-    try:
-        import cv2
-        # Try to open a device
-        cap = cv2.VideoCapture(0)
-        if cap.isOpened():
-            cap.release()
-            return True
+    """Check if UVC is available, without opening any device"""
+    if platform.system() != 'Darwin':
+        # UVC devices show up as V4L2 nodes elsewhere
+        return bool(glob.glob('/dev/video*'))
+    
+    # UVC capture goes through CoreMediaIO
+    if not os.path.exists('/System/Library/Frameworks/CoreMediaIO.framework'):
         return False
-    except ImportError:
+    
+    if _has_usb_video_interface():
+        return True
+    
+    # Fall back to whether an OpenCV capture backend is installed at all
+    return importlib.util.find_spec('cv2') is not None
+
+def _has_usb_video_interface() -> bool:
+    """Check the USB registry for a video-class (UVC) interface"""
+    try:
+        result = subprocess.run(
+            ['ioreg', '-r', '-c', 'IOUSBHostDevice', '-l'],
+            capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
         return False
+    # USB interface class 14 is Video
+    return '"bInterfaceClass" = 14\n' in result.stdout
 
-def get_limited_features() -> list:
-    """Get list of features that are limited on current platform"""
+@functools.lru_cache(maxsize=1)
+def _feature_index() -> Tuple[FrozenSet[str], Tuple[str, ...], Mapping[str, Any]]:
+    """Build (supported, limited, limits) for the current platform once"""
     capabilities = get_capabilities()
     features = capabilities.get('features', {})
-    
-    limited = []
-    for feature, supported in features.items():
-        if not supported:
-            limited.append(feature)
-    
-    return limited
+    return (
+        frozenset(feature for feature, supported in features.items() if supported),
+        tuple(feature for feature, supported in features.items() if not supported),
+        capabilities.get('limits', MappingProxyType({}))
+    )
+
+def get_limited_features() -> Tuple[str, ...]:
+    """Get features that are limited on current platform"""
+    return _feature_index()[1]
 
 def is_feature_supported(feature: str) -> bool:
     """Check if a specific feature is supported on current platform"""
-    capabilities = get_capabilities()
-    features = capabilities.get('features', {})
-    return features.get(feature, False)
+    return feature in _feature_index()[0]
 
-def get_feature_limits() -> Dict[str, Any]:
-    """Get feature limits for current platform"""
-    capabilities = get_capabilities()
-    return capabilities.get('limits', {})
+def get_feature_limits() -> Mapping[str, Any]:
+    """Get feature limits for current platform (read-only)"""
+    return _feature_index()[2]
 
 def get_platform_info() -> Dict[str, str]:
     """Get platform information"""
@@ -8,10 +8,12 @@ capability detection and cross-platform support.
 
 import sys
 import time
+import logging
 from template_controller import TemplateController, DeviceError, UnsupportedFeatureError
 
 def main():
     """Main example function"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("Template Device Example")
     print("=" * 50)
     
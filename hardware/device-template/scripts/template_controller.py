@@ -5,10 +5,41 @@ Main controller class for template device with cross-platform support.
 Automatically selects the best available driver for the current platform.
 """
 
+import functools
+import logging
 import platform
 import time
-from typing import Optional, Dict, Any
-from .capabilities import get_capabilities, is_feature_supported, get_feature_limits
+from types import MappingProxyType
+from typing import Optional, Any, Mapping
+from .capabilities import (
+    get_capabilities, get_feature_limits, get_limited_features, invalidate_capabilities_cache
+)
+
+logger = logging.getLogger(__name__)
+
+# Current platform, fixed for the life of the process
+_PLATFORM = platform.system().lower()
+
+def reload_capabilities() -> None:
+    """Re-read device-config.json and rebind the capabilities shared by controllers
+    
+    Controllers created before the call keep the capabilities they were
+    built with; invalidate_capabilities_cache() alone does not reach them.
+    """
+    global _CAPS, _LIMITS, _FEATURES, _LIMITED_FEATURES, _LIMITED_FEATURES_STR, _PLATFORM_BANNER
+    invalidate_capabilities_cache()
+    _CAPS = get_capabilities()
+    _LIMITS = get_feature_limits()
+    _FEATURES = _CAPS.get('features', MappingProxyType({}))
+    _LIMITED_FEATURES = get_limited_features()
+    _LIMITED_FEATURES_STR = ', '.join(_LIMITED_FEATURES)
+    _PLATFORM_BANNER = f"{_CAPS.get('os', 'Unknown')} ({_CAPS.get('transport', 'Unknown')})"
+
+# Platform capabilities, shared read-only by every controller
+reload_capabilities()
+
+# Modes accepted by set_mode
+_VALID_MODES = frozenset({"normal", "high_performance", "low_power"})
 
 class DeviceError(Exception):
     """Base exception for device errors"""
@@ -22,6 +53,15 @@ class ConnectionError(DeviceError):
     """Raised when device connection fails"""
     pass
 
+def _requires_connection(method):
+    """Raise DeviceError unless the controller is connected"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.connected:
+            raise DeviceError("Device not connected")
+        return method(self, *args, **kwargs)
+    return wrapper
+
 class TemplateController:
     """
     Template Device Controller
@@ -30,6 +70,12 @@ class TemplateController:
     and capability-based feature availability.
     """
     
+    __slots__ = (
+        'connected', 'model', 'serial', 'firmware_version',
+        'capabilities', 'limits', '_has_basic', '_has_advanced',
+        'enabled', 'mode', 'timeout', '_driver_instance'
+    )
+    
     def __init__(self):
         self.connected = False
         self.model = "Template Device"
@@ -37,30 +83,32 @@ class TemplateController:
         self.firmware_version = "1.0.0"
         
         # Get platform capabilities
-        self.capabilities = get_capabilities()
-        self.limits = self.capabilities.get('limits', {})
+        self.capabilities = _CAPS
+        self.limits = _LIMITS
+        self._has_basic = _FEATURES.get('basicControl', False)
+        self._has_advanced = _FEATURES.get('advancedControl', False)
         
         # Current settings
         self.enabled = False
         self.mode = "normal"
         self.timeout = 5.0
         
-        # Platform-specific driver
-        self._driver = None
-        self._init_driver()
+        # Platform-specific driver, created on first use so capability
+        # queries never construct one
+        self._driver_instance = None
+    
+    @property
+    def _driver(self):
+        """Platform-specific driver, initialized on first access"""
+        if self._driver_instance is None:
+            self._driver_instance = self._init_driver()
+        return self._driver_instance
     
     def _init_driver(self):
         """Initialize platform-specific driver"""
-        current_platform = platform.system().lower()
-        
-        if current_platform == 'windows':
-            self._driver = WindowsTemplateDriver()
-        elif current_platform == 'linux':
-            self._driver = LinuxTemplateDriver()
-        elif current_platform == 'darwin':
-            self._driver = MacOSTemplateDriver()
-        else:
-            raise DeviceError(f"Unsupported platform: {current_platform}")
+        if _DRIVER_FACTORY is None:
+            raise DeviceError(f"Unsupported platform: {_PLATFORM}")
+        return _DRIVER_FACTORY()
     
     def connect(self, identifier: Optional[str] = None) -> bool:
         """
@@ -80,13 +128,13 @@ class TemplateController:
             if success:
                 self.connected = True
                 self.serial = identifier or "TEMPLATE-001"
-                print(f"Connected to {self.model} (Serial: {self.serial})")
-                print(f"Platform: {self.capabilities['os']} ({self.capabilities['transport']})")
-                
-                # Show limited features
-                limited_features = [f for f, supported in self.capabilities['features'].items() if not supported]
-                if limited_features:
-                    print(f"Limited features: {', '.join(limited_features)}")
+                logger.info("Connected to %s (Serial: %s)", self.model, self.serial)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Platform: %s", _PLATFORM_BANNER)
+                    
+                    # Show limited features
+                    if _LIMITED_FEATURES:
+                        logger.info("Limited features: %s", _LIMITED_FEATURES_STR)
             return success
         except Exception as e:
             raise ConnectionError(f"Failed to connect: {e}")
@@ -101,13 +149,14 @@ class TemplateController:
         success = self._driver.disconnect()
         if success:
             self.connected = False
-            print("Disconnected from device")
+            logger.info("Disconnected from device")
         return success
     
     def is_connected(self) -> bool:
         """Check if device is connected"""
         return self.connected and self._driver.is_connected()
     
+    @_requires_connection
     def initialize(self) -> bool:
         """
         Initialize device
@@ -116,19 +165,15 @@ class TemplateController:
             True if initialization successful
             
         Raises:
-            DeviceError: If not connected or initialization fails
+            DeviceError: If not connected or the driver reports initialization failed
         """
-        if not self.connected:
-            raise DeviceError("Device not connected")
-        
-        try:
-            success = self._driver.initialize()
-            if success:
-                print("Device initialized")
-            return success
-        except Exception as e:
-            raise DeviceError(f"Failed to initialize: {e}")
+        success = self._driver.initialize()
+        if success is False:
+            raise DeviceError("Failed to initialize")
+        logger.info("Device initialized")
+        return success
     
+    @_requires_connection
     def reset(self) -> bool:
         """
         Reset device to default state
@@ -137,38 +182,31 @@ class TemplateController:
             True if reset successful
             
         Raises:
-            DeviceError: If not connected or reset fails
+            DeviceError: If not connected or the driver reports reset failed
         """
-        if not self.connected:
-            raise DeviceError("Device not connected")
-        
-        try:
-            success = self._driver.reset()
-            if success:
-                print("Device reset to default state")
-            return success
-        except Exception as e:
-            raise DeviceError(f"Failed to reset: {e}")
+        success = self._driver.reset()
+        if success is False:
+            raise DeviceError("Failed to reset")
+        logger.info("Device reset to default state")
+        return success
     
-    def get_status(self) -> Dict[str, Any]:
+    @_requires_connection
+    def get_status(self) -> Mapping[str, Any]:
         """
         Get device status
         
         Returns:
-            Dictionary containing device status
+            Read-only mapping containing device status
             
         Raises:
-            DeviceError: If not connected or status retrieval fails
+            DeviceError: If not connected or the driver returns no status
         """
-        if not self.connected:
-            raise DeviceError("Device not connected")
-        
-        try:
-            status = self._driver.get_status()
-            return status
-        except Exception as e:
-            raise DeviceError(f"Failed to get status: {e}")
+        status = self._driver.get_status()
+        if status is None:
+            raise DeviceError("Failed to get status")
+        return status
     
+    @_requires_connection
     def set_enabled(self, enabled: bool) -> bool:
         """
         Enable/disable device
@@ -182,18 +220,16 @@ class TemplateController:
         Raises:
             DeviceError: If not connected or setting fails
         """
-        if not self.connected:
-            raise DeviceError("Device not connected")
-        
-        if not is_feature_supported('basicControl'):
+        if not self._has_basic:
             raise UnsupportedFeatureError("Basic control not supported on this platform")
         
         success = self._driver.set_enabled(enabled)
         if success:
             self.enabled = enabled
-            print(f"Device {'enabled' if enabled else 'disabled'}")
+            logger.debug("Device %s", 'enabled' if enabled else 'disabled')
         return success
     
+    @_requires_connection
     def set_mode(self, mode: str) -> bool:
         """
         Set device mode
@@ -208,21 +244,19 @@ class TemplateController:
             DeviceError: If not connected or setting fails
             UnsupportedFeatureError: If advanced control not supported
         """
-        if not self.connected:
-            raise DeviceError("Device not connected")
-        
-        if not is_feature_supported('advancedControl'):
+        if not self._has_advanced:
             raise UnsupportedFeatureError("Advanced control not supported on this platform")
         
-        if mode not in ["normal", "high_performance", "low_power"]:
+        if mode not in _VALID_MODES:
             raise DeviceError("Invalid mode")
         
         success = self._driver.set_mode(mode)
         if success:
             self.mode = mode
-            print(f"Device mode set to {mode}")
+            logger.debug("Device mode set to %s", mode)
         return success
     
+    @_requires_connection
     def set_timeout(self, timeout: float) -> bool:
         """
         Set device timeout
@@ -236,86 +270,58 @@ class TemplateController:
         Raises:
             DeviceError: If not connected or setting fails
         """
-        if not self.connected:
-            raise DeviceError("Device not connected")
-        
         success = self._driver.set_timeout(timeout)
         if success:
             self.timeout = timeout
-            print(f"Timeout set to {timeout}s")
+            logger.debug("Timeout set to %ss", timeout)
         return success
     
-    def get_capabilities(self) -> Dict[str, Any]:
-        """Get current platform capabilities"""
-        return self.capabilities.copy()
+    def get_capabilities(self) -> Mapping[str, Any]:
+        """Get current platform capabilities (read-only view)"""
+        return self.capabilities
     
-    def get_limits(self) -> Dict[str, Any]:
-        """Get feature limits for current platform"""
-        return self.limits.copy()
+    def get_limits(self) -> Mapping[str, Any]:
+        """Get feature limits for current platform (read-only view)"""
+        return self.limits
     
     def is_feature_supported(self, feature: str) -> bool:
         """Check if feature is supported on current platform"""
-        return is_feature_supported(feature)
+        return bool(_FEATURES.get(feature, False))
 
 
-# Platform-specific driver implementations
+# Platform-specific driver implementation
 
-class WindowsTemplateDriver:
-    """Windows driver using native API"""
-    
-    def __init__(self):
-        self.connected = False
-    
-    def connect(self, identifier: Optional[str]) -> bool:
-        print("Connecting via Windows native driver...")
-        # Simulate connection
-        self.connected = True
-        return True
-    
-    def disconnect(self) -> bool:
-        self.connected = False
-        return True
-    
-    def is_connected(self) -> bool:
-        return self.connected
-    
-    def initialize(self) -> bool:
-        print("Initializing device (Windows native)")
-        return True
-    
-    def reset(self) -> bool:
-        print("Resetting device (Windows native)")
-        return True
-    
-    def get_status(self) -> Dict[str, Any]:
-        return {
-            "status": "ready",
-            "temperature": 25.0,
-            "voltage": 12.0,
-            "current": 1.5
-        }
+# Status reported by the simulated driver; shared, so polling allocates nothing
+_DEFAULT_STATUS: Mapping[str, Any] = MappingProxyType({
+    "status": "ready",
+    "temperature": 25.0,
+    "voltage": 12.0,
+    "current": 1.5
+})
+
+class TemplateDriver:
+    """Template driver, parameterised by platform
     
-    def set_enabled(self, enabled: bool) -> bool:
-        print(f"Setting enabled: {enabled} (Windows native)")
-        return True
+    Failures are reported by return value (False, or None from get_status)
+    rather than by raising, so the controller's success path needs no
+    exception handler. The one exception is set_mode, which raises
+    UnsupportedFeatureError when supports_advanced is False.
     
-    def set_mode(self, mode: str) -> bool:
-        print(f"Setting mode: {mode} (Windows native)")
-        return True
+    Args:
+        tag: Platform label used in log messages
+        supports_advanced: False where the transport lacks advanced control
+    """
     
-    def set_timeout(self, timeout: float) -> bool:
-        print(f"Setting timeout: {timeout}s (Windows native)")
-        return True
-
-
-class LinuxTemplateDriver:
-    """Linux driver using V4L2/USB"""
+    __slots__ = ('connected', '_tag', 'supports_advanced')
     
-    def __init__(self):
+    def __init__(self, tag: str, supports_advanced: bool):
         self.connected = False
+        self._tag = tag
+        self.supports_advanced = supports_advanced
     
     def connect(self, identifier: Optional[str]) -> bool:
-        print("Connecting via Linux driver...")
+        logger.info("Connecting via %s driver%s...", self._tag,
+                    "" if self.supports_advanced else " (limited features)")
         # Simulate connection
         self.connected = True
         return True
@@ -328,79 +334,40 @@ class LinuxTemplateDriver:
         return self.connected
     
     def initialize(self) -> bool:
-        print("Initializing device (Linux)")
+        logger.debug("Initializing device (%s)", self._tag)
         return True
     
     def reset(self) -> bool:
-        print("Resetting device (Linux)")
+        logger.debug("Resetting device (%s)", self._tag)
         return True
     
-    def get_status(self) -> Dict[str, Any]:
-        return {
-            "status": "ready",
-            "temperature": 25.0,
-            "voltage": 12.0,
-            "current": 1.5
-        }
+    def get_status(self) -> Mapping[str, Any]:
+        return _DEFAULT_STATUS
     
     def set_enabled(self, enabled: bool) -> bool:
-        print(f"Setting enabled: {enabled} (Linux)")
+        logger.debug("Setting enabled: %s (%s)", enabled, self._tag)
         return True
     
     def set_mode(self, mode: str) -> bool:
-        print(f"Setting mode: {mode} (Linux)")
+        if not self.supports_advanced:
+            raise UnsupportedFeatureError(f"Advanced control not supported on {self._tag}")
+        logger.debug("Setting mode: %s (%s)", mode, self._tag)
         return True
     
     def set_timeout(self, timeout: float) -> bool:
-        print(f"Setting timeout: {timeout}s (Linux)")
+        logger.debug("Setting timeout: %ss (%s)", timeout, self._tag)
         return True
 
 
-class MacOSTemplateDriver:
-    """macOS driver using UVC/AVFoundation (limited features)"""
-    
-    def __init__(self):
-        self.connected = False
-    
-    def connect(self, identifier: Optional[str]) -> bool:
-        print("Connecting via macOS driver (limited features)...")
-        # Simulate connection
-        self.connected = True
-        return True
-    
-    def disconnect(self) -> bool:
-        self.connected = False
-        return True
-    
-    def is_connected(self) -> bool:
-        return self.connected
-    
-    def initialize(self) -> bool:
-        print("Initializing device (macOS)")
-        return True
-    
-    def reset(self) -> bool:
-        print("Resetting device (macOS)")
-        return True
-    
-    def get_status(self) -> Dict[str, Any]:
-        return {
-            "status": "ready",
-            "temperature": 25.0,
-            "voltage": 12.0,
-            "current": 1.5
-        }
-    
-    def set_enabled(self, enabled: bool) -> bool:
-        print(f"Setting enabled: {enabled} (macOS)")
-        return True
-    
-    def set_mode(self, mode: str) -> bool:
-        raise UnsupportedFeatureError("Advanced control not supported on macOS")
-    
-    def set_timeout(self, timeout: float) -> bool:
-        print(f"Setting timeout: {timeout}s (macOS)")
-        return True
+# Driver factory for each platform.system() name
+_DRIVER_MAP = {
+    'windows': functools.partial(TemplateDriver, 'Windows native', True),
+    'linux': functools.partial(TemplateDriver, 'Linux', True),
+    'darwin': functools.partial(TemplateDriver, 'macOS', False)
+}
+
+# Factory for this platform, or None; the error is raised when a driver is needed
+_DRIVER_FACTORY = _DRIVER_MAP.get(_PLATFORM)
 
 
 
@@ -305,7 +305,7 @@ export class DeviceRegistry {
             { name: 'takeup', label: 'Takeup Steps', type: 'number', default: 6 },
             { name: 'settle_ms', label: 'Settle Delay', type: 'number', default: 40 }
           ],
-          driver: { module: 'Jankomotor8812.scripts.jankomotor_controller', class: 'SimpleJankomotorController', connection: { type: 'serial', port: 'auto', baudrate: 9600, timeout: 1.0 } }
+          driver: { module: 'Jankomotor8812.scripts.jankomotor_controller', class: 'SimpleJankomotorController', connection: { type: 'serial', port: 'auto', baudrate: 115200, timeout: 1.0 } }
         },
         'NewportESP': {
           type: 'stage.newport.esp',
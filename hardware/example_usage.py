@@ -5,28 +5,49 @@ Hardware Control Example
 This script demonstrates how to use the hardware control modules
 from the LightWorks hardware folder.
 
-Usage:
-    python example_usage.py
+Usage (from the LightWorks project root):
+    python -m hardware.example_usage
 """
 
-import sys
-import os
+import importlib
+import importlib.util
+import inspect
 
-# Add the hardware folder to Python path
-hardware_path = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, hardware_path)
+JANKOMOTOR_MODULE = 'hardware.Jankomotor8812.scripts.jankomotor_controller'
 
-# Import hardware control modules
-try:
-    from Jankomotor8812.scripts.jankomotor_client import JankomotorClient
+def module_available(name: str) -> bool:
+    """Check that a dotted module path exists without importing it"""
+    # find_spec raises if a parent package is missing, so walk down the path
+    parts = name.split('.')
+    return all(
+        importlib.util.find_spec('.'.join(parts[:i])) is not None
+        for i in range(1, len(parts) + 1)
+    )
+
+def load_jankomotor_controller():
+    """Load the Jankomotor 8812 controller class, or None if it is not installed"""
+    if not module_available(JANKOMOTOR_MODULE):
+        print("✗ Jankomotor 8812 control module not found")
+        return None
+    
+    try:
+        controller_class = importlib.import_module(JANKOMOTOR_MODULE).SimpleJankomotorController
+    except ImportError as e:
+        # The module needs pyserial
+        print(f"✗ Failed to load Jankomotor 8812 module: {e}")
+        return None
     print("✓ Jankomotor 8812 control module loaded")
-except ImportError as e:
-    print(f"✗ Failed to load Jankomotor 8812 module: {e}")
+    return controller_class
 
 def demo_jankomotor():
     """Demonstrate Jankomotor 8812 control"""
     print("\n=== Jankomotor 8812 Demo ===")
     
+    # Import the hardware control module only when the demo runs
+    controller_class = load_jankomotor_controller()
+    if controller_class is None:
+        return
+    
     # Note: This is a demo - actual hardware connection would require
     # a real serial port and connected device
     
@@ -34,18 +55,12 @@ def demo_jankomotor():
     print("Initializing Jankomotor 8812 controller...")
     print("Note: This demo shows the interface - actual hardware required for real control")
     
-    # Show available commands
+    # Show available commands, read from the controller itself
     print("\nAvailable commands:")
-    print("- enable() - Enable motor system")
-    print("- disable() - Disable motor system") 
-    print("- move_x(steps) - Move X axis relative")
-    print("- move_y(steps) - Move Y axis relative")
-    print("- move_xy(x_steps, y_steps) - Move both axes")
-    print("- get_position() - Get current X,Y position")
-    print("- home() - Home both axes")
-    print("- set_timing() - Set timing parameters")
-    print("- start_raster_scan() - Start raster scan")
-    print("- stop() - Emergency stop all motion")
+    for name, method in inspect.getmembers(controller_class, inspect.isfunction):
+        if not name.startswith('_'):
+            summary = (inspect.getdoc(method) or "").split('\n', 1)[0]
+            print(f"- {name}() - {summary}")
 
 def main():
     """Main example function"""
@@ -61,7 +76,7 @@ def main():
     print("1. Upload Jankomotor8812.ino to your Arduino")
     print("2. Connect Arduino via USB serial")
     print("3. Update the serial port in the scripts")
-    print("4. Run the example_usage.py script")
+    print("4. Run: python -m hardware.example_usage")
     print("5. Or integrate into your LightWorks application")
 
 if __name__ == "__main__":